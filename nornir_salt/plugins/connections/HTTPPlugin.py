@@ -9,9 +9,24 @@ HTTPPlugin reference
 
 .. autofunction:: nornir_salt.plugins.connections.HTTPPlugin.HTTPPlugin
 """
+import logging
+
 from typing import Any, Dict, Optional
 from nornir.core.configuration import Config
 
+log = logging.getLogger(__name__)
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    HAS_REQUESTS = True
+except ImportError:
+    log.debug(
+        "nornir_salt:HTTPPlugin failed import requests library, install: pip install requests"
+    )
+    HAS_REQUESTS = False
+
 CONNECTION_NAME = "http"
 
 
@@ -55,11 +70,21 @@ class HTTPPlugin:
 
     Anything under inventory extras section passed on to
     ``requests.request(method, url, **kwargs)`` call in a form of ``**kwargs``
-    except for ``transport`` and ``base_url``. Inventory parameters can be
-    overridden on task call.
+    except for ``transport``, ``base_url``, ``pool_connections`` and ``pool_maxsize``.
+    Inventory parameters can be overridden on task call.
+
+    ``pool_connections`` and ``pool_maxsize`` - session ``HTTPAdapter`` connections
+    pool parameters, default to the greater of 10 and Nornir runner ``num_workers``.
+    Increase ``pool_maxsize`` if ``Connection pool is full, discarding connection``
+    warnings logged.
 
     ``transport`` and ``base_url`` - used to form URL to send request to if no
     absolute URL provided on task call.
+
+    Connection maintains ``requests.Session`` object to reuse underlying TCP/TLS
+    connections across multiple requests sent to the same host. Session ``auth``
+    formed using host's username and password and ``verify`` set to inventory
+    extras ``verify`` value if any.
     """  # noqa
 
     def open(
@@ -73,9 +98,31 @@ class HTTPPlugin:
         configuration: Optional[Config],
     ) -> None:
         """
-        HTTP does not maintain connection open, hence this method does nothing
-        apart from saving inventory parameters in connection dictionary.
+        Save inventory parameters in connection dictionary together with
+        ``requests.Session`` object to use for sending requests.
         """
+        session = None
+        if HAS_REQUESTS:
+            session = requests.Session()
+            # set auth and verify on session once, per-call values override them
+            if hostname and password:
+                session.auth = (username, password)
+            if "verify" in (extras or {}):
+                session.verify = extras["verify"]
+            # size connections pool to number of Nornir workers
+            num_workers = 20
+            if configuration is not None:
+                num_workers = configuration.runner.options.get("num_workers", 20)
+            adapter = HTTPAdapter(
+                pool_connections=(extras or {}).get(
+                    "pool_connections", max(10, num_workers)
+                ),
+                pool_maxsize=(extras or {}).get("pool_maxsize", max(10, num_workers)),
+                pool_block=False,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
         self.connection = {
             "extras": extras,
             "configuration": configuration,
@@ -84,10 +131,13 @@ class HTTPPlugin:
             "password": password,
             "port": port,
             "platform": platform,
+            "session": session,
         }
 
     def close(self) -> None:
         """
-        HTTP does not maintain connection open, hence this method does nothing.
+        Close ``requests.Session`` pooled connections.
         """
+        if self.connection.get("session"):
+            self.connection["session"].close()
         self.connection = {}
@@ -272,6 +272,8 @@ log = logging.getLogger(__name__)
 try:
     import yaml
 
+    # use libyaml based C emitter if available
+    YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
     HAS_YAML = True
 except ImportError:
     log.debug(
@@ -397,9 +399,12 @@ def to_yaml(data, **kwargs):
     :param data: (structure) Python structure to transform
     :param kwargs: (dict) additional kwargs for ``yaml.dump`` method
     :return: pretty print formatted string
+
+    Uses ``yaml.CDumper`` LibYAML based dumper if PyYAML compiled with LibYAML
+    bindings, falls back to pure Python ``yaml.Dumper`` otherwise.
     """
-    kwargs = {"default_flow_style": False, **kwargs}
     if HAS_YAML:
+        kwargs = {"default_flow_style": False, "Dumper": YAML_DUMPER, **kwargs}
         return yaml.dump(data, **kwargs)
     else:
         return to_pprint(data)
@@ -424,11 +429,10 @@ def load_xml(data, py_dict=True, **kwargs):
     :param kwargs: (dict) any additional ``**kwargs`` for ``xmltodict.parse`` method
     :returns: python dictionary
     """
-    parsed = xmltodict.parse(data, **kwargs)
-    # pass parsed results through json to get rid of ordered dictionary
+    # construct normal dictionaries while parsing instead of ordered dictionaries
     if py_dict:
-        parsed = json.loads(json.dumps(parsed))
-    return parsed
+        kwargs.setdefault("dict_constructor", dict)
+    return xmltodict.parse(data, **kwargs)
 
 
 def load_json(data, **kwargs):
@@ -77,6 +77,7 @@ class ToFileProcessor:
                         "filename": "/var/salt-nornir/nrp1/files/facts__10_June_2022_13_42_36__683__ceos1.txt",
                         "tasks": {
                             "run_ttp": {
+                                "byte_span": [0, 139],
                                 "content_type": "json",
                                 "span": [0, 139]
                             }
@@ -91,6 +92,7 @@ class ToFileProcessor:
                         "filename": "/var/salt-nornir/nrp1/files/show_clock_output__10_June_2022_14_34_20__1__ceos1.txt",
                         "tasks": {
                             "show clock": {
+                                "byte_span": [0, 59],
                                 "content_type": "str",
                                 "span": [0, 59]
                             }
@@ -103,7 +105,8 @@ class ToFileProcessor:
 
     Where ``config`` is ``tf`` attribute value, ``"show run | inc ntp": [0, 48]`` -
     ``show run | inc ntp`` task results span indexes inside
-    ``./tofile_outputs/config__22_August_2021_14_08_33__IOL1.txt`` text file.
+    ``./tofile_outputs/config__22_August_2021_14_08_33__IOL1.txt`` text file,
+    ``byte_span`` - same span but in bytes offsets of UTF-8 encoded text file content.
 
     ``tf_index_{index}.json`` used by other plugins to retrieve previous results for the task,
     it could be considered as a simplified index database.
@@ -198,6 +201,7 @@ class ToFileProcessor:
                     },
                 )
                 span_start = 0
+                byte_span_start = 0
 
                 for i in result:
                     # skip if has skip_results and no exception
@@ -234,6 +238,15 @@ class ToFileProcessor:
                     ] = span
                     span_start += len(result_to_save) + 1  # f.write appends \n hence +1
 
+                    # add bytes span to read task results without reading whole file
+                    byte_span_end = (
+                        byte_span_start + len(result_to_save.encode("utf-8")) + 1
+                    )
+                    self.aliases_data[self.tf][host.name][0]["tasks"][i.name][
+                        "byte_span"
+                    ] = (byte_span_start, byte_span_end)
+                    byte_span_start = byte_span_end
+
             # check if need to delete old files
             if len(self.aliases_data[self.tf][host.name]) > self.max_files:
                 file_to_rm = self.aliases_data[self.tf][host.name].pop(-1)
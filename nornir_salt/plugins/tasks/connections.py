@@ -52,7 +52,6 @@ API reference
 .. autofunction:: nornir_salt.plugins.tasks.connections.conn_open
 """
 import time
-import traceback
 import logging
 import copy
 import socket
@@ -90,15 +89,21 @@ def conn_list(task, conn_name: str = "all") -> list:
     :return: list of hosts' connections
     """
     # form list of host connections
-    ret = [
-        {
-            "connection_name": conn,
-            "connection_plugin": str(type(conn_obj)).split(" ")[1].strip(">"),
-            "connection_action": "list",
-        }
-        for conn, conn_obj in task.host.connections.items()
-        if conn_name == "all" or conn == conn_name
-    ]
+    ret = []
+    for conn, conn_obj in task.host.connections.items():
+        if conn_name != "all" and conn != conn_name:
+            continue
+        conn_type = type(conn_obj)
+        ret.append(
+            {
+                "connection_name": conn,
+                # keep quoted 'module.Class' format of str(type(conn_obj)) output
+                "connection_plugin": "'{}.{}'".format(
+                    conn_type.__module__, conn_type.__qualname__
+                ),
+                "connection_action": "list",
+            }
+        )
 
     return Result(host=task.host, result=ret)
 
@@ -113,17 +118,28 @@ def conn_close(task, conn_name: str = "all") -> list:
     """
     ret = []
 
+    # decide on connections to close
+    if conn_name == "all":
+        connections_to_close = tuple(task.host.connections)
+    elif conn_name in task.host.connections:
+        connections_to_close = (conn_name,)
+    else:
+        connections_to_close = ()
+
     # iterate over connections and close them
-    for conn in list(task.host.connections.keys()):
-        if conn_name != "all" and conn != conn_name:
-            continue
+    for conn in connections_to_close:
         ret.append({"connection_name": conn, "connection_action": "close"})
         try:
             task.host.close_connection(conn)
-        except:
-            ret[-1]["status"] = traceback.format_exc()
-        _ = task.host.connections.pop(conn, None)
-        ret[-1].setdefault("status", "closed")
+            ret[-1]["status"] = "closed"
+        except Exception as e:
+            ret[-1]["status"] = repr(e)
+            log.debug(
+                f"nornir_salt:conn_close {task.host.name} '{conn}' close failed",
+                exc_info=True,
+            )
+        finally:
+            task.host.connections.pop(conn, None)
 
     return Result(host=task.host, result=ret)
 
@@ -401,17 +417,29 @@ def conn_open(
                 f"nornir_salt:conn_open {host.name} via '{via}' parameters not found"
             )
     else:
-        conn_params = [
-            {
-                "hostname": str(hostname) if hostname is not None else None,
-                "username": str(username) if username is not None else None,
-                "password": str(password) if password is not None else None,
-                "port": int(port) if port is not None else None,
-                "platform": str(platform) if platform is not None else None,
-                "extras": extras,
-                "default_to_host_attributes": default_to_host_attributes,
-            }
-        ] + reconnect
+        # only pass parameters that were provided, open_connection
+        # defaults the rest to None
+        primary = {
+            k: v
+            for k, v in (
+                ("hostname", hostname),
+                ("username", username),
+                ("password", password),
+                ("port", port),
+                ("platform", platform),
+            )
+            if v is not None
+        }
+        if "port" in primary:
+            primary["port"] = int(primary["port"])
+        primary["extras"] = extras
+        primary["default_to_host_attributes"] = default_to_host_attributes
+        conn_params = [primary] + reconnect
+
+    # source inventory credentials section once if any reconnect refers to it
+    credentials = {}
+    if any(isinstance(i, str) for i in conn_params):
+        credentials = host.get("credentials", {}) or {}
 
     for index, param in enumerate(conn_params):
         param_name = "kwargs" if index == 0 else index
@@ -420,7 +448,7 @@ def conn_open(
         # source parameters from inventory credentials section
         if isinstance(param, str):
             param_name = param
-            param = host.get("credentials", {}).get(param)
+            param = credentials.get(param)
 
         if not isinstance(param, dict):
             raise TypeError("'{}' parameters not found or invalid".format(param_name))
@@ -452,6 +480,9 @@ def conn_open(
                 res_msg = f"{conn_name} connected with reconnect index '{index - 1}' connection parameters"
                 log_msg = f"nornir_salt:conn_open {host.name} '{conn_name}' re-connecting with index '{index - 1}' connection parameters"
             log.info(log_msg)
+            # clean up connection object left behind by previous failed attempt
+            if index > 0 and conn_name in host.connections:
+                host.connections.pop(conn_name, None)
             # establish host connection
             if redispatch is not None:
                 if conn_name != "netmiko":
@@ -466,11 +497,15 @@ def conn_open(
                 )
             ret = {"result": res_msg}
             break
-        except:
-            tb = traceback.format_exc()
+        except Exception as e:
+            error = repr(e)
+            log.debug(
+                f"nornir_salt:conn_open {host.name} '{conn_name}' connection failed",
+                exc_info=True,
+            )
             ret = {
-                "result": f"{conn_name} connection failed\n\n{tb}",
-                "exception": tb,
+                "result": f"{conn_name} connection failed\n\n{error}",
+                "exception": error,
                 "failed": True,
             }
             time.sleep(0.1)
@@ -527,6 +562,14 @@ def conn_check(
     return result
 
 
+connections_dispatcher = {
+    "ls": conn_list,
+    "close": conn_close,
+    "open": conn_open,
+    "check": conn_check,
+}
+
+
 @ValidateFuncArgs(model_connections)
 def connections(task, call, **kwargs):
     """
@@ -545,11 +588,5 @@ def connections(task, call, **kwargs):
     * check - calls conn_check task
     """
     task.name = "connections"
-    dispatcher = {
-        "ls": conn_list,
-        "close": conn_close,
-        "open": conn_open,
-        "check": conn_check,
-    }
 
-    return dispatcher[call](task, **kwargs)
+    return connections_dispatcher[call](task, **kwargs)
@@ -57,8 +57,10 @@ files dispatcher function
 .. autofunction:: nornir_salt.plugins.tasks.files.files
 """
 import os
+import functools
 import json
 import difflib
+import filecmp
 import logging
 
 from nornir.core.task import Result
@@ -74,6 +76,266 @@ from multiprocessing import Lock
 
 log = logging.getLogger(__name__)
 
+# cache of index files content and parsed data keyed by index file path
+_index_cache = {}
+
+# cache of file_list rows keyed by index file path
+_file_list_cache = {}
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    log.debug(
+        "nornir_salt:files failed import orjson library, falling back to json, install: pip install orjson"
+    )
+    HAS_ORJSON = False
+
+try:
+    from cdifflib import CSequenceMatcher
+
+    HAS_CDIFFLIB = True
+except ImportError:
+    log.debug(
+        "nornir_salt:files failed import cdifflib library, install: pip install cdifflib"
+    )
+    HAS_CDIFFLIB = False
+
+try:
+    from diff_match_patch import diff_match_patch
+
+    HAS_DMP = True
+except ImportError:
+    log.debug(
+        "nornir_salt:files failed import diff_match_patch library, install: pip install diff-match-patch"
+    )
+    HAS_DMP = False
+
+
+def _json_loads(data):
+    """
+    Helper function to decode JSON using orjson if it is installed, falling
+    back to json library for content orjson does not support e.g. NaN values.
+
+    :param data: (str or bytes) JSON content to decode
+    :return: decoded data
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+class _DiffMatchPatchMatcher:
+    """
+    Sequence matcher that sources opcodes from diff-match-patch line mode
+    diff instead of difflib's pure Python matching algorithm.
+
+    :param isjunk: not used, accepted for compatibility with ``difflib``
+    :param a: (str) old lines encoded as characters
+    :param b: (str) new lines encoded as characters
+    """
+
+    def __init__(self, isjunk=None, a="", b=""):
+        self.a = a
+        self.b = b
+
+    def get_opcodes(self):
+        dmp = diff_match_patch()
+        opcodes = []
+        i = j = 0
+        # each character represents one line
+        for op, chars in dmp.diff_main(self.a, self.b, False):
+            size = len(chars)
+            if op == dmp.DIFF_EQUAL:
+                opcodes.append(("equal", i, i + size, j, j + size))
+                i += size
+                j += size
+                continue
+            if op == dmp.DIFF_DELETE:
+                i1, i2, j1, j2 = i, i + size, j, j
+                i += size
+            else:
+                i1, i2, j1, j2 = i, i, j, j + size
+                j += size
+            # merge adjacent delete and insert into replace
+            if opcodes and opcodes[-1][0] != "equal":
+                _, i1, _, j1, _ = opcodes.pop()
+                opcodes.append(("replace", i1, i2, j1, j2))
+            else:
+                opcodes.append(("delete" if i2 > i1 else "insert", i1, i2, j1, j2))
+        return opcodes
+
+
+class _LinesView:
+    """
+    Read-only view of diff-match-patch line mode encoded text that
+    decodes lines on slicing.
+
+    :param chars: (str) lines encoded as characters
+    :param lines: (list) list of lines indexed by characters ordinals
+    """
+
+    __slots__ = ("chars", "lines")
+
+    def __init__(self, chars: str, lines: list):
+        self.chars = chars
+        self.lines = lines
+
+    def __len__(self):
+        return len(self.chars)
+
+    def __getitem__(self, index: slice) -> list:
+        return [self.lines[ord(c)] for c in self.chars[index]]
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """
+    Helper function to convert range to the unified diff "ed" format,
+    same as difflib does.
+    """
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return "{}".format(beginning)
+    if not length:
+        beginning -= 1
+    return "{},{}".format(beginning, length)
+
+
+def _group_opcodes(codes: list, n: int = 3):
+    """
+    Helper function to group opcodes into hunks with up to ``n`` lines
+    of context, same as ``difflib.SequenceMatcher.get_grouped_opcodes``.
+
+    :param codes: list of opcodes tuples
+    :param n: (int) number of context lines
+    :return: generator of opcodes groups
+    """
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+    # fixup leading and trailing groups if they show no changes
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+    nn = n + n
+    group = []
+    for tag, i1, i2, j1, j2 in codes:
+        # end the current group and start a new one whenever
+        # there is a large range with no changes
+        if tag == "equal" and i2 - i1 > nn:
+            group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _unified_diff(
+    old_data: str,
+    new_data: str,
+    fromfile: str = "",
+    tofile: str = "",
+    engine: str = "difflib",
+    n: int = 3,
+):
+    """
+    Helper function to produce unified diff lines using given diff engine.
+    Output uses the same unified diff format as ``difflib.unified_diff``, hunk
+    alignment may differ from difflib.
+
+    :param old_data: (str) old text to diff
+    :param new_data: (str) new text to diff
+    :param fromfile: (str) old file name to use in diff header
+    :param tofile: (str) new file name to use in diff header
+    :param engine: (str) diff engine to use - ``difflib``, ``cdifflib`` or ``dmp``
+    :param n: (int) number of context lines
+    :return: generator of diff lines
+    """
+    if engine == "dmp" and HAS_DMP:
+        # encode lines as characters without splitting text into list of lines
+        seq_a, seq_b, lines = diff_match_patch().diff_linesToChars(
+            old_data, new_data
+        )
+        a, b = _LinesView(seq_a, lines), _LinesView(seq_b, lines)
+    else:
+        if engine not in ("difflib", "cdifflib") or (
+            engine == "cdifflib" and not HAS_CDIFFLIB
+        ):
+            log.warning(
+                "nornir-salt:files:diff '{}' engine not available, using difflib".format(
+                    engine
+                )
+            )
+            engine = "difflib"
+        seq_a = a = old_data.splitlines(keepends=True)
+        seq_b = b = new_data.splitlines(keepends=True)
+
+    # strip common prefix and suffix lines to reduce amount of lines to match
+    size_a, size_b = len(seq_a), len(seq_b)
+    prefix = 0
+    while prefix < min(size_a, size_b) and seq_a[prefix] == seq_b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < min(size_a, size_b) - prefix
+        and seq_a[size_a - suffix - 1] == seq_b[size_b - suffix - 1]
+    ):
+        suffix += 1
+    seq_a = seq_a[prefix : size_a - suffix]
+    seq_b = seq_b[prefix : size_b - suffix]
+
+    if engine == "dmp":
+        matcher = _DiffMatchPatchMatcher(None, seq_a, seq_b)
+    else:
+        # encode remaining lines as integers to match them using cheap integer
+        # hashing and comparison, lines content only used to render the diff
+        lines_ids = {}
+        seq_a = [lines_ids.setdefault(i, len(lines_ids)) for i in seq_a]
+        seq_b = [lines_ids.setdefault(i, len(lines_ids)) for i in seq_b]
+        matcher_class = (
+            CSequenceMatcher if engine == "cdifflib" else difflib.SequenceMatcher
+        )
+        matcher = matcher_class(None, seq_a, seq_b)
+
+    # shift opcodes back to original lines positions
+    codes = [("equal", 0, prefix, 0, prefix)] if prefix else []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        codes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        codes.append(("equal", size_a - suffix, size_a, size_b - suffix, size_b))
+
+    started = False
+    for group in _group_opcodes(codes, n):
+        if not started:
+            started = True
+            yield "--- {}\n".format(fromfile)
+            yield "+++ {}\n".format(tofile)
+        first, last = group[0], group[-1]
+        yield "@@ -{} +{} @@\n".format(
+            _format_range_unified(first[1], last[2]),
+            _format_range_unified(first[3], last[4]),
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
+
 
 def _read_content(
     task, task_name: str, task_details: dict, data: str, timestamp: str, group: str
@@ -85,7 +347,8 @@ def _read_content(
     :param task: (obj) Nornir task object
     :param task_name: (str) Name of the task to process
     :param task_details: (dict) details of task from ToFileProcessor index file
-    :param data: (str) content of file with previous results
+    :param data: (str) content of file with previous results, could be
+        partial content that ends at or after task span end
     :param group: (str) ``tf`` files group name
     :returns: None
     """
@@ -93,7 +356,7 @@ def _read_content(
     # "end - 1" to account for ToFileProcessor adds "+\n" to the end
     content = data[start : end - 1]
     if task_details["content_type"] == "json":
-        content = json.loads(content)
+        content = _json_loads(content)
     task.results.append(
         Result(
             host=task.host,
@@ -105,25 +368,83 @@ def _read_content(
     )
 
 
-def _load_index_data(base_url, index):
+@functools.lru_cache(maxsize=32)
+def _index_path(base_url: str, index: str) -> str:
+    """
+    Helper function to form index file OS path.
+
+    :param base_url: (str) OS path to folder with saved files
+    :param index: (str) ``ToFileProcessor`` index filename
+    :return: OS path to index file
+    """
+    return os.path.join(base_url, "tf_index_{}.json".format(index))
+
+
+def _load_index_data(base_url, index, read_only=False):
     """
     Helper function to load json index file and return python dictionary.
 
+    Parsed index data cached in memory and reused for as long as index file
+    content stays the same. Content compared instead of file modification time
+    and size, as ``ToFileProcessor`` rewrites index file in place and same size
+    rewrite within file system timestamp granularity would go unnoticed.
+
     :param base_url: (str) OS path to folder where to save files, default "/var/nornir-salt/"
     :param index: (str) ``ToFileProcessor`` index filename to read files information from
+    :param read_only: (bool) if True, returns cached index data as is, caller must not
+        modify returned dictionary, otherwise returns freshly parsed index data
     :return: Dictionary of index data
     """
-    index_file = os.path.join(base_url, "tf_index_{}.json".format(index))
+    index_file = _index_path(base_url, index)
 
-    if not os.path.exists(index_file):
+    try:
+        with open(index_file, mode="rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        _index_cache.pop(index_file, None)
         return {}
 
-    with open(index_file, mode="r", encoding="utf-8") as f:
-        index_data = json.loads(f.read())
+    # parsing already read content is cheaper than deep copying cached data
+    if not read_only:
+        return _json_loads(content)
+
+    cached = _index_cache.get(index_file)
+    if cached is not None and cached[0] == content:
+        return cached[1]
+    index_data = _json_loads(content)
+    _index_cache[index_file] = (content, index_data)
 
     return index_data
 
 
+def _bulk_file_list(index_data, hostnames=None):
+    """
+    Helper function to produce ``file_list`` rows for all hosts in a single
+    pass over index data.
+
+    :param index_data: (dict) ``ToFileProcessor`` index data
+    :param hostnames: (list) list of hosts names to produce rows for, all hosts if None
+    :return: dictionary keyed by host name of dictionaries keyed by filegroup
+        name of files details rows lists
+    """
+    ret = {}
+    for group, per_host in index_data.items():
+        for host, entries in per_host.items():
+            if hostnames is not None and host not in hostnames:
+                continue
+            ret.setdefault(host, {})[group] = [
+                {
+                    "host": host,
+                    "filegroup": group,
+                    "last": index + 1,
+                    "tasks": "\n".join(file_details.get("tasks", {})),
+                    **{k: v for k, v in file_details.items() if k != "tasks"},
+                }
+                for index, file_details in enumerate(entries)
+            ]
+    return ret
+
+
 @ValidateFuncArgs(model_file_read)
 def file_read(
     task,
@@ -152,9 +473,10 @@ def file_read(
         raise RuntimeError("nornir-salt:file_read bad filegroup '{}'".format(filegroup))
 
     # load index data
-    index_data = _load_index_data(base_url, index)
+    index_data = _load_index_data(base_url, index, read_only=True)
 
     filegrous = [filegroup] if isinstance(filegroup, str) else filegroup
+    files_content = {}  # cache of files content loaded by this call
 
     for group in filegrous:
         # do sanity check
@@ -182,21 +504,38 @@ def file_read(
             )
             continue
 
+        host_entries = index_data[group][task.host.name]
+
         # get previous results metadata
-        res_index = min(last - 1, len(index_data[group][task.host.name]) - 1)
-        prev_res_details = index_data[group][task.host.name][res_index]
+        res_index = min(last - 1, len(host_entries) - 1)
+        prev_res_details = host_entries[res_index]
         timestamp = prev_res_details["timestamp"]
 
-        # load file content
-        with open(prev_res_details["filename"], mode="r", encoding="utf-8") as f:
-            data = f.read()
+        filename = prev_res_details["filename"]
 
         # check if need to load results for certain task only
         if task_name:
             task_details = prev_res_details["tasks"][task_name]
+            # read task content bytes only if index contains bytes span
+            if "byte_span" in task_details and hasattr(os, "pread"):
+                start, end = task_details["byte_span"]
+                fd = os.open(filename, os.O_RDONLY)
+                try:
+                    data = os.pread(fd, end - 1 - start, start).decode("utf-8")
+                finally:
+                    os.close(fd)
+                task_details = {**task_details, "span": (0, len(data) + 1)}
+            # read file content up to the end of task span only
+            else:
+                with open(filename, mode="r", encoding="utf-8") as f:
+                    data = f.read(task_details["span"][1] - 1)
             _read_content(task, task_name, task_details, data, timestamp, group)
         # load content of all tasks reconstructing them in Nornir result objects
         else:
+            if filename not in files_content:
+                with open(filename, mode="r", encoding="utf-8") as f:
+                    files_content[filename] = f.read()
+            data = files_content[filename]
             for _task_name, task_details in prev_res_details["tasks"].items():
                 _read_content(task, _task_name, task_details, data, timestamp, group)
 
@@ -219,7 +558,15 @@ def file_list(
     ret = []
 
     # load index data
-    index_data = _load_index_data(base_url, index)
+    index_data = _load_index_data(base_url, index, read_only=True)
+
+    # produce rows for all hosts once per index data version
+    index_file = _index_path(base_url, index)
+    cached = _file_list_cache.get(index_file)
+    if cached is None or cached[0] is not index_data:
+        cached = (index_data, _bulk_file_list(index_data))
+        _file_list_cache[index_file] = cached
+    host_rows = cached[1].get(task.host.name, {})
 
     if filegroup:
         filegroups = [filegroup] if isinstance(filegroup, str) else filegroup
@@ -240,18 +587,8 @@ def file_list(
             )
             continue
 
-        # iterate over previous results
-        for index, file_details in enumerate(index_data[group].get(task.host.name, [])):
-            tasks = file_details.pop("tasks")
-            ret.append(
-                {
-                    "host": task.host.name,
-                    "filegroup": group,
-                    "last": index + 1,
-                    "tasks": "\n".join(list(tasks.keys())),
-                    **file_details,
-                }
-            )
+        # copy rows to not expose cached data to callers
+        ret.extend(dict(row) for row in host_rows.get(group, []))
 
     return Result(host=task.host, result=ret)
 
@@ -306,29 +643,49 @@ def file_remove(
                 continue
 
             # iterate over previous results
-            for file_details in index_data[group].get(task.host.name, []):
+            host_entries = index_data[group].pop(task.host.name, [])
+            failed_entries = []
+            for file_details in host_entries:
                 filename = file_details["filename"]
-                tasks = file_details.pop("tasks")
-                if os.path.exists(filename):
+                try:
                     os.remove(filename)
-                    ret.append(
-                        {
-                            "host": task.host.name,
-                            "filegroup": group,
-                            "tasks": "\n".join(list(tasks.keys())),
-                            **file_details,
-                        }
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    log.warning(
+                        "nornir-salt:file_remove failed to remove file '{}': {}".format(
+                            filename, e
+                        )
                     )
-
-            # clean up index data
-            _ = index_data[group].pop(task.host.name, None)
-
-        # save new index data
-        index_file = os.path.join(base_url, "tf_index_{}.json".format(index))
-        with open(index_file, mode="w", encoding="utf-8") as f:
-            f.write(
-                json.dumps(index_data, sort_keys=True, indent=4, separators=(",", ": "))
+                    failed_entries.append(file_details)
+                    continue
+                ret.append(
+                    {
+                        "host": task.host.name,
+                        "filegroup": group,
+                        "tasks": "\n".join(file_details.get("tasks", {})),
+                        **{k: v for k, v in file_details.items() if k != "tasks"},
+                    }
+                )
+            # keep index entries for files that failed to be removed
+            if failed_entries:
+                index_data[group][task.host.name] = failed_entries
+
+        # save new index data to temporary file and atomically replace index file
+        index_file = _index_path(base_url, index)
+        index_file_tmp = "{}.tmp".format(index_file)
+        if HAS_ORJSON:
+            index_data_dump = orjson.dumps(
+                index_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2
             )
+        else:
+            index_data_dump = json.dumps(
+                index_data, sort_keys=True, indent=4, separators=(",", ": ")
+            ).encode(encoding="utf-8")
+        with open(index_file_tmp, mode="wb") as f:
+            f.write(index_data_dump)
+        os.replace(index_file_tmp, index_file)
+        _index_cache[index_file] = (index_data_dump, _json_loads(index_data_dump))
 
         return Result(host=task.host, result=ret)
     except Exception as e:
@@ -345,6 +702,9 @@ def file_diff(
     task_name: str = None,
     last=None,
     index: str = "common",
+    engine: str = "difflib",
+    max_diff_size: int = None,
+    changed_only: bool = False,
 ):
     """
     Function to read text files content saved by ``ToFileProcessor`` and
@@ -357,12 +717,24 @@ def file_diff(
     :param task_name: (str) name of task to read previous results for, diffs all results
         if ``task_name`` is empty.
     :param index: (str) ``ToFileProcessor`` index filename to read files information from
+    :param engine: (str) diff engine to use - ``difflib`` (default), ``cdifflib`` or ``dmp``,
+        falls back to ``difflib`` if engine library not installed
+    :param max_diff_size: (int) maximum number of characters of difference to return,
+        difference truncated if exceeds this size, default is no limit
+    :param changed_only: (bool) if True, skips producing difference and returns True
+        if files are different and False if files are identical
     :return: Result object with files difference, if files are identical result is True
+
+    ``cdifflib`` engine uses C implementation of ``difflib`` sequence matcher and requires
+    ``cdifflib`` library, ``dmp`` engine uses Google's diff-match-patch line mode diff and
+    requires ``diff-match-patch`` library. Both engines are considerably faster than pure
+    Python ``difflib`` for large files while producing the same unified diff format,
+    hunk alignment may differ from ``difflib.unified_diff`` output.
     """
     last = last or [1, 2]
 
     # load index data
-    index_data = _load_index_data(base_url, index)
+    index_data = _load_index_data(base_url, index, read_only=True)
 
     # get indexes of files to diff
     if isinstance(last, int):
@@ -406,9 +778,11 @@ def file_diff(
                 )
             )
             continue
+        host_entries = index_data[group][task.host.name]
+
         # get previous results metadata
-        new_res_index = min(new - 1, len(index_data[group][task.host.name]) - 1)
-        old_res_index = min(old - 1, len(index_data[group][task.host.name]) - 1)
+        new_res_index = min(new - 1, len(host_entries) - 1)
+        old_res_index = min(old - 1, len(host_entries) - 1)
 
         # check if new and old reference same file
         if new_res_index == old_res_index:
@@ -424,14 +798,8 @@ def file_diff(
             )
             continue
 
-        new_res_details = index_data[group][task.host.name][new_res_index]
-        old_res_details = index_data[group][task.host.name][old_res_index]
-
-        # load files content
-        with open(new_res_details["filename"], mode="r", encoding="utf-8") as f:
-            new_res_data = f.read()
-        with open(old_res_details["filename"], mode="r", encoding="utf-8") as f:
-            old_res_data = f.read()
+        new_res_details = host_entries[new_res_index]
+        old_res_details = host_entries[old_res_index]
 
         # if task_name given, retrieve task results content
         if task_name:
@@ -441,23 +809,63 @@ def file_diff(
             # get task span
             new_start, new_end = new_task_details["span"]
             old_start, old_end = old_task_details["span"]
-            # get task text results to diff
-            new_todiff_data = new_res_data[new_start : new_end - 1]
-            old_todiff_data = old_res_data[old_start : old_end - 1]
+            # get task text results to diff, spans are characters offsets,
+            # read files up to the end of task span only
+            with open(new_res_details["filename"], mode="r", encoding="utf-8") as f:
+                new_todiff_data = f.read(new_end - 1)[new_start:]
+            with open(old_res_details["filename"], mode="r", encoding="utf-8") as f:
+                old_todiff_data = f.read(old_end - 1)[old_start:]
         # use all data for diff
         else:
-            new_todiff_data = new_res_data
-            old_todiff_data = old_res_data
+            # skip diff if files content is identical
+            if filecmp.cmp(
+                new_res_details["filename"], old_res_details["filename"], shallow=False
+            ):
+                task.results.append(
+                    Result(host=task.host, result=not changed_only, name=group)
+                )
+                continue
+            with open(new_res_details["filename"], mode="r", encoding="utf-8") as f:
+                new_todiff_data = f.read()
+            with open(old_res_details["filename"], mode="r", encoding="utf-8") as f:
+                old_todiff_data = f.read()
+
+        # check if only need to know if there is a difference
+        if changed_only:
+            task.results.append(
+                Result(
+                    host=task.host,
+                    result=old_todiff_data != new_todiff_data,
+                    name=group,
+                )
+            )
+            continue
 
         # run diff
-        difference = difflib.unified_diff(
-            a=old_todiff_data.splitlines(keepends=True),
-            b=new_todiff_data.splitlines(keepends=True),
+        difference = _unified_diff(
+            old_data=old_todiff_data,
+            new_data=new_todiff_data,
             fromfile=old_res_details["filename"],
             tofile=new_res_details["filename"],
+            engine=engine,
         )
 
-        res = "".join(difference)
+        # collect difference lines up to max_diff_size
+        if max_diff_size:
+            res, size = [], 0
+            for line in difference:
+                size += len(line)
+                if size > max_diff_size:
+                    res.append(
+                        "\n... difference truncated, exceeded max_diff_size {}\n".format(
+                            max_diff_size
+                        )
+                    )
+                    break
+                res.append(line)
+            res = "".join(res)
+        else:
+            res = "".join(difference)
         res = res if res else True
         task.results.append(Result(host=task.host, result=res, name=group))
 
@@ -43,22 +43,111 @@ requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
 log = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    log.debug(
+        "nornir_salt:http_call failed import orjson library, falling back to json, install: pip install orjson"
+    )
+    HAS_ORJSON = False
+
+try:
+    import ijson
+
+    HAS_IJSON = True
+except ImportError:
+    log.debug(
+        "nornir_salt:http_call failed import ijson library, install: pip install ijson"
+    )
+    HAS_IJSON = False
+
 # define connection name for RetryRunner to properly detect it using:
 # connection_name = task.task.__globals__.get("CONNECTION_NAME", None)
 CONNECTION_NAME = "http"
 
+# absolute URL schemes
+HTTP_SCHEMES = ("http://", "https://")
+
+# supported HTTP methods
+HTTP_METHODS = {"get", "post", "put", "patch", "delete", "head", "options"}
+
+
+def _get_url_prefix(conn: dict, transport: str) -> str:
+    """
+    Helper function to form ``{transport}://{hostname}:{port}`` URL prefix,
+    prefix cached in host's connection dictionary as hostname and port
+    are static for the lifetime of connection.
+
+    :param conn: http connection dictionary
+    :param transport: (str) transport to use e.g. ``http`` or ``https``
+    :return: URL prefix string
+    """
+    url_prefixes = conn.setdefault("url_prefixes", {})
+    if transport not in url_prefixes:
+        # connection port is None if not defined in inventory
+        port = conn.get("port") or (80 if transport == "http" else 443)
+        url_prefixes[transport] = "{transport}://{hostname}:{port}".format(
+            transport=transport,
+            hostname=conn["hostname"],
+            port=port if isinstance(port, int) else int(port),
+        )
+    return url_prefixes[transport]
+
+
+def _json_path_items(json_path: str) -> bool:
+    """
+    Helper function to check if ``json_path`` iterates over list items.
+
+    :param json_path: (str) dot separated keys path e.g. ``a.item.b``
+    :return: True if ``json_path`` contains ``item`` segment
+    """
+    return "item" in json_path.split(".")
+
+
+def _json_path_lookup(data, json_path: str):
+    """
+    Helper function to retrieve value from parsed JSON data using dot
+    separated keys path with the same semantics as ``ijson`` prefixes -
+    ``item`` segment iterates over list elements.
+
+    :param data: parsed JSON data
+    :param json_path: (str) dot separated keys path e.g. ``a.b.c`` or ``a.item.b``
+    :return: list of values if path contains ``item`` segment, value at given
+        path or None if path not found otherwise
+    """
+    values = [data]
+    for key in json_path.split("."):
+        matched = []
+        for value in values:
+            if key == "item" and isinstance(value, list):
+                matched.extend(value)
+            elif isinstance(value, dict) and key in value:
+                matched.append(value[key])
+        values = matched
+    if _json_path_items(json_path):
+        return values
+    return values[0] if values else None
+
 
 @ValidateFuncArgs(model_http_call)
-def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
+def http_call(
+    task: Task, method: str, url: str = None, json_path: str = None, **kwargs
+) -> Result:
     """
     Task function to call one of the supported ``requests`` library methods.
 
-    :param method: (str) requests method to call
+    :param method: (str) HTTP method to use - ``get``, ``post``, ``put``, ``patch``,
+        ``delete``, ``head`` or ``options``
     :param url: (str) relative to base_url or absolute URL to send request to
+    :param json_path: (str) dot separated keys path e.g. ``data.interfaces`` to
+        return only this portion of JSON response, ``item`` key iterates over list
+        elements e.g. ``data.interfaces.item.name``
     :param kwargs: (dict) any ``**kwargs`` to use with requests method call
-    :return: (str) attempt to return JSON formatted string if ``json`` string
-        pattern found in response's ``Content-type`` header, returns response
-        text otherwise
+    :return: (str) attempt to return JSON formatted string if response's ``Content-type``
+        header is a JSON media type e.g. ``application/json`` or ``application/yang-data+json``,
+        returns response text otherwise
 
     ``http_call`` follows these rules to form URL to send request to:
 
@@ -86,7 +175,24 @@ def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
 
     If no ``auth`` attribute provided in task ``kwargs``, host's username and
     password inventory parameters used to form ``auth`` tuple.
+
+    If ``ijson`` library installed, JSON responses requested with ``json_path`` or
+    ``stream=True`` parsed incrementally while being downloaded. If ``json_path``
+    provided, only that portion of JSON response parsed into Python objects skipping
+    the rest of it. ``json_path`` follows ``ijson`` prefix syntax whether ``ijson``
+    installed or not - dictionary keys separated by dots, with ``item`` key matching
+    each element of a list, in which case list of all matched values returned e.g.
+    ``a.item.b`` returns ``[1, 2]`` for ``{"a": [{"b": 1}, {"b": 2}]}``.
+    The rest of response still downloaded after parsing, for connection to be reused
+    by subsequent requests. Streamed response content is not kept in memory, if it
+    fails to parse as JSON, failed result returned with parsing error.
     """
+    if method.lower() not in HTTP_METHODS:
+        raise ValueError(
+            "nornir-salt:http_call unsupported method '{}', supported: {}".format(
+                method, ", ".join(sorted(HTTP_METHODS))
+            )
+        )
     result = None
     task.name = method
 
@@ -109,9 +215,18 @@ def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
     # clean up parameters
     transport = parameters.pop("transport", None)
     base_url = parameters.pop("base_url", None)
-
-    # add auth
-    if "auth" not in parameters and conn.get("hostname") and conn.get("password"):
+    parameters.pop("pool_connections", None)
+    parameters.pop("pool_maxsize", None)
+
+    session = conn.get("session")
+
+    # add auth if connection session does not have it already
+    if (
+        "auth" not in parameters
+        and session is None
+        and conn.get("hostname")
+        and conn.get("password")
+    ):
         parameters["auth"] = (conn["username"], conn["password"])
     # make sure auth is a tuple
     elif "auth" in parameters:
@@ -120,34 +235,27 @@ def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
     # form url
     if url:
         # if URL provided but it is relative to base url
-        if not url.startswith("http://") and not url.startswith("https://"):
+        if not url.startswith(HTTP_SCHEMES):
             # use base URL if it was provided in inventory and it is absolute
-            if base_url and base_url.startswith("http"):
+            if base_url and base_url.startswith(HTTP_SCHEMES):
                 parameters["url"] = "{base_url}/{url}".format(
                     base_url=base_url.strip("/"), url=url.strip("/")
                 )
             # use base_url if it was provided in inventory and it is relative
             elif (
                 base_url
-                and not base_url.startswith("http")
+                and not base_url.startswith(HTTP_SCHEMES)
                 and not url.startswith(base_url)
             ):
-                parameters[
-                    "url"
-                ] = "{transport}://{hostname}:{port}/{base_url}/{url}".format(
-                    transport=transport,
-                    hostname=conn["hostname"],
-                    port=int(conn.get("port", 80 if transport == "http" else 443)),
+                parameters["url"] = "{prefix}/{base_url}/{url}".format(
+                    prefix=_get_url_prefix(conn, transport),
                     base_url=base_url.strip("/"),
                     url=url.strip("/"),
                 )
             # form URL using transport, hostname and port parameters
             elif transport:
-                parameters["url"] = "{transport}://{hostname}:{port}/{url}".format(
-                    transport=transport,
-                    hostname=conn["hostname"],
-                    port=int(conn.get("port", 80 if transport == "http" else 443)),
-                    url=url.strip("/"),
+                parameters["url"] = "{prefix}/{url}".format(
+                    prefix=_get_url_prefix(conn, transport), url=url.strip("/")
                 )
             else:
                 raise RuntimeError(
@@ -158,14 +266,12 @@ def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
         else:
             parameters["url"] = url
     # use base_url if no url provided
-    elif base_url and base_url.startswith("http"):
+    elif base_url and base_url.startswith(HTTP_SCHEMES):
         parameters["url"] = base_url
     # form url using transport, hostname and port parameters
     elif transport:
-        parameters["url"] = "{transport}://{hostname}:{port}/".format(
-            transport=transport,
-            hostname=conn["hostname"],
-            port=int(conn.get("port", 80 if transport == "http" else 443)),
+        parameters["url"] = "{prefix}/".format(
+            prefix=_get_url_prefix(conn, transport)
         )
     else:
         raise RuntimeError(
@@ -174,6 +280,10 @@ def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
             )
         )
 
+    # stream response to parse JSON documents portion while downloading them
+    if HAS_IJSON and json_path:
+        parameters.setdefault("stream", True)
+
     # add headers
     parameters.setdefault(
         "headers",
@@ -189,19 +299,57 @@ def http_call(task: Task, method: str, url: str = None, **kwargs) -> Result:
             method, parameters
         )
     )
-    response = getattr(requests, method)(**parameters)
-
-    response.raise_for_status()
-
-    # form results
-    if "json" in response.headers.get("Content-type", "text"):
+    response = (session or requests).request(method, **parameters)
+
+    try:
+        response.raise_for_status()
+    except requests.exceptions.HTTPError:
+        response.close()
+        raise
+
+    # form results decoding response content bytes directly to avoid
+    # requests encoding detection
+    encoding = response.encoding or "utf-8"
+    content_type = response.headers.get("Content-Type", "").lower()
+    # match JSON media types e.g. application/json or application/yang-data+json
+    is_json = content_type.startswith("application/json") or "+json" in content_type
+    if is_json and HAS_IJSON and parameters.get("stream"):
+        # build only json_path portion of response if any
+        response.raw.decode_content = True
         try:
-            result = response.json()
-        except requests.exceptions.ContentDecodingError:
-            result = response.text
-        except json.decoder.JSONDecodeError:
-            result = response.text
+            items = ijson.items(response.raw, json_path or "", use_float=True)
+            if json_path and _json_path_items(json_path):
+                result = list(items)
+            else:
+                result = next(items, None)
+        except (ijson.JSONError, ValueError) as e:
+            return Result(
+                host=task.host,
+                result=None,
+                failed=True,
+                exception="nornir-salt:http_call failed to parse JSON response: {}".format(
+                    e
+                ),
+            )
+        finally:
+            # read the rest of response content for connection to be returned
+            # to session's pool on close instead of being closed
+            try:
+                while response.raw.read(65536):
+                    pass
+            finally:
+                response.close()
+    elif is_json:
+        try:
+            if HAS_ORJSON:
+                result = orjson.loads(response.content)
+            else:
+                result = json.loads(response.content)
+            if json_path:
+                result = _json_path_lookup(result, json_path)
+        except (requests.exceptions.ContentDecodingError, ValueError):
+            result = response.content.decode(encoding, errors="replace")
     else:
-        result = response.text
+        result = response.content.decode(encoding, errors="replace")
 
     return Result(host=task.host, result=result, failed=not response.ok)
@@ -69,6 +69,7 @@ def napalm_send_commands(
     interval=None,
     new_line_char: str = "_br_",
     split_lines: bool = True,
+    batch_size: int = 1,
 ):
     """
     Nornir Task function to send show commands to devices using ``napalm_cli`` task
@@ -91,6 +92,8 @@ def napalm_send_commands(
         before sending command to device, default is ``_br_``, useful to simulate enter key
     :param split_lines: (bool) if True split multiline string to commands, send multiline
         string to device as is otherwise
+    :param batch_size: (int) number of commands to send at once in between ``interval``
+        pauses, default is 1 - sleep ``interval`` after every command
     :return result: Nornir result object with task results named after commands
     """
     # run sanity check
@@ -108,12 +111,13 @@ def napalm_send_commands(
         new_line_char=new_line_char,
     )
 
-    # send commands one by one
+    # send commands in batches of batch_size commands
     if interval:
-        for index, command in enumerate(commands):
-            task.run(task=napalm_cli, commands=[command])
-            # do not sleep after last command sent
-            if index != len(commands) - 1:
+        batch_size = max(1, batch_size or 1)
+        for index in range(0, len(commands), batch_size):
+            task.run(task=napalm_cli, commands=commands[index : index + batch_size])
+            # do not sleep after last batch sent
+            if index + batch_size < len(commands):
                 time.sleep(interval)
     # send all at once
     else:
@@ -121,18 +125,17 @@ def napalm_send_commands(
 
     # iterate over results and form per-command results
     per_command_results = []
-    while task.results:
-        res = task.results.pop()
+    for res in task.results:
         # check if task failed, do nothing if so
         if res.failed or res.exception:
             per_command_results.append(res)
             continue
         # iterate over dictionary result and construct per-command result
-        for command, output in res.result.items():
-            per_command_results.append(
-                Result(host=task.host, result=output, name=command.strip())
-            )
-    task.results.extend(per_command_results)
+        per_command_results.extend(
+            Result(host=task.host, result=output, name=command.strip())
+            for command, output in res.result.items()
+        )
+    task.results[:] = per_command_results
 
     # set skip_results to True, for ResultSerializer to ignore
     # results for grouped task itself, which are usually None
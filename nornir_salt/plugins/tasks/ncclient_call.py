@@ -64,9 +64,9 @@ ncclient_call - transaction
 
 .. autofunction:: nornir_salt.plugins.tasks.ncclient_call._call_transaction
 """
-import traceback
 import logging
 import time
+import weakref
 
 from fnmatch import fnmatchcase
 from nornir.core.task import Result, Task
@@ -85,11 +85,18 @@ except ImportError:
 
 try:
     from ncclient.manager import OPERATIONS
+    from ncclient.operations import MissingCapabilityError
 
     HAS_NCCLIENT = True
 except ImportError:
     HAS_NCCLIENT = False
 
+# cache of managers' capabilities support flags
+_capabilities_cache = weakref.WeakKeyDictionary()
+
+# cache of public attributes names of manager classes
+_manager_class_dir_cache = {}
+
 try:
     # this import should work for ncclient >=0.6.10
     from ncclient.operations import GenericRPC
@@ -103,26 +110,35 @@ except ImportError:
         class GenericRPC(RPC):
             def request(self, data, *args, **kwargs):
                 """
-                :param data: (str) rpc xml string
+                :param data: (str or bytes) rpc xml string
 
                 Testing:
 
                 * Arista cEOS - not working, transport session closed error
                 * Cisco IOS-XR - working
                 """
-                ele = etree.fromstring(data.encode("UTF-8"))  # nosec
+                if isinstance(data, str):
+                    data = data.encode("UTF-8")
+                ele = etree.fromstring(data)  # nosec
                 return self._request(ele)
 
 
-def _form_result(result) -> str:
+def _form_result(result, pretty_print: bool = True) -> str:
     """
     Helper function to extract XML string results from Ncclient
     response.
 
     :param result: (obj) Ncclient RPC call result object
+    :param pretty_print: (bool) if True (default) pretty prints XML string
+
+    Replies serialized without XML declaration, as lxml does not support parsing
+    unicode strings that contain encoding declaration.
     """
     if hasattr(result, "_root"):
-        result = etree.tostring(result._root, pretty_print=True).decode()
+        # serialize directly to unicode string, skipping intermediate bytes copy
+        result = etree.tostring(
+            result._root, pretty_print=pretty_print, encoding="unicode"
+        )
     elif isinstance(result, (list, dict, bool)):
         pass
     else:
@@ -131,6 +147,24 @@ def _form_result(result) -> str:
     return result
 
 
+def _get_capabilities(manager) -> dict:
+    """
+    Helper function to check once and cache manager's server support of
+    capabilities used by transaction.
+
+    :param manager: Ncclient manager object
+    :return: dictionary keyed by capability name with boolean values
+    """
+    capabilities = _capabilities_cache.get(manager)
+    if capabilities is None:
+        capabilities = {
+            c: c in manager.server_capabilities
+            for c in (":validate", ":confirmed-commit", ":candidate")
+        }
+        _capabilities_cache[manager] = capabilities
+    return capabilities
+
+
 def _call_transaction(manager, *args, **kwargs):
     """
     Function to edit device configuration in a reliable fashion using
@@ -149,6 +183,7 @@ def _call_transaction(manager, *args, **kwargs):
         (default), "load_configuration" (juniper devices only)
     :param edit_arg: (dict) dictionary of arguments to use with configuration edit RPC
     :param commit_arg: (dict) dictionary of commit RPC arguments used with first commit call
+    :param pretty: (bool) if True (default) pretty prints steps RPC replies XML strings
     :returns result: (list) list of steps performed with details
 
     Function work flow:
@@ -172,72 +207,85 @@ def _call_transaction(manager, *args, **kwargs):
     result = []
     failed = False
     edit_rpc = kwargs.get("edit_rpc", "edit_config")
-    commit_arg = kwargs.get("commit_arg", {})
+    commit_arg = dict(kwargs.get("commit_arg", {}))
     commit_final_delay = int(kwargs.get("commit_final_delay", 1))
+    pretty = kwargs.get("pretty", True)
+    do_validate = kwargs.get("validate", True)
+    do_confirmed = kwargs.get("confirmed", True)
 
     # ncclient expects timeout to be a string
     confirm_delay = str(kwargs.get("confirm_delay", 60))
 
     # get capabilities
-    can_validate = ":validate" in manager.server_capabilities
-    can_commit_confirmed = ":confirmed-commit" in manager.server_capabilities
-    has_candidate_datastore = ":candidate" in manager.server_capabilities
+    capabilities = _get_capabilities(manager)
+    can_validate = capabilities[":validate"]
+    can_commit_confirmed = capabilities[":confirmed-commit"]
+    has_candidate_datastore = capabilities[":candidate"]
 
     # decide on target configuration datastore
-    target = kwargs.get("target", "candidate" if has_candidate_datastore else "running")
+    target = kwargs.get("target") or (
+        "candidate" if has_candidate_datastore else "running"
+    )
+    use_candidate = has_candidate_datastore and target == "candidate"
 
     # form edit RPC arguments
-    edit_arg = kwargs.get("edit_arg", {})
-    edit_arg["config"] = kwargs["config"]
-    edit_arg["target"] = target
+    edit_arg = {
+        **kwargs.get("edit_arg", {}),
+        "config": kwargs["config"],
+        "target": target,
+    }
 
     # execute transaction
     with manager.locked(target=target):
-        if has_candidate_datastore and target == "candidate":
+        if use_candidate:
             r = manager.discard_changes()
-            result.append({"discard_changes": _form_result(r)})
+            result.append({"discard_changes": _form_result(r, pretty)})
         try:
             r = getattr(manager, edit_rpc)(**edit_arg)
-            result.append({edit_rpc: _form_result(r)})
+            result.append({edit_rpc: _form_result(r, pretty)})
             # validate configuration
-            if can_validate and kwargs.get("validate", True):
+            if can_validate and do_validate:
                 r = manager.validate(source=target)
-                result.append({"validate": _form_result(r)})
-            if target == "candidate" and has_candidate_datastore:
+                result.append({"validate": _form_result(r, pretty)})
+            if use_candidate:
                 # run commit confirmed
-                if can_commit_confirmed and kwargs.get("confirmed", True):
+                if can_commit_confirmed and do_confirmed:
                     commit_arg["confirmed"] = True
                     commit_arg.setdefault("timeout", confirm_delay)
                     # try runing commit confirmed using RFC6241 standart
                     try:
                         pid = "dob04041989"
                         r = manager.commit(**commit_arg, persist=pid)
-                        result.append({"commit_confirmed": _form_result(r)})
+                        result.append({"commit_confirmed": _form_result(r, pretty)})
                         # run final commit
                         time.sleep(commit_final_delay)
                         r = manager.commit(confirmed=True, persist_id=pid)
-                        result.append({"commit": _form_result(r)})
+                        result.append({"commit": _form_result(r, pretty)})
                     # Ncclient juniper driver uses juniper custom RPC for
                     # commit and throws TypeError for "persist" argument
                     except TypeError:
                         r = manager.commit(**commit_arg)
-                        result.append({"commit_confirmed": _form_result(r)})
+                        result.append({"commit_confirmed": _form_result(r, pretty)})
                         # run final commit
                         time.sleep(commit_final_delay)
                         r = manager.commit()
-                        result.append({"commit": _form_result(r)})
+                        result.append({"commit": _form_result(r, pretty)})
                 # run normal commit
                 else:
                     r = manager.commit(**commit_arg)
-                    result.append({"commit": _form_result(r)})
-        except:
-            tb = traceback.format_exc()
-            log.error(f"nornir_salt:ncclient_call transaction error: {tb}")
-            result.append({"error": tb})
-            if has_candidate_datastore and target == "candidate":
-                r = manager.discard_changes()
-                result.append({"discard_changes": _form_result(r)})
+                    result.append({"commit": _form_result(r, pretty)})
+        # server does not support requested operation, no need for traceback
+        except MissingCapabilityError as e:
+            log.error("nornir_salt:ncclient_call transaction missing capability: %s", e)
+            result.append({"capability_missing": str(e)})
+            failed = True
+        except Exception as e:
+            log.exception("nornir_salt:ncclient_call transaction error")
+            result.append({"error": repr(e)})
             failed = True
+        if failed and use_candidate:
+            r = manager.discard_changes()
+            result.append({"discard_changes": _form_result(r)})
 
     return result, failed
 
@@ -267,16 +315,34 @@ def _call_connected(manager, *args, **kwargs):
 
 def _call_dir(manager, *args, **kwargs):
     """Function to return a list of available methods/operations"""
-    methods = (
-        list(dir(manager))
-        + list(manager._vendor_operations.keys())
-        + list(OPERATIONS.keys())
-        + ["dir", "help", "transaction"]
-    )
+    # re-use cached results if no new operations added since they were produced
+    cache_key = len(manager._vendor_operations)
+    cached = getattr(manager, "_nornir_salt_dir_cache", None)
+    if cached and cached[0] == cache_key:
+        return list(cached[1]), False
+
+    # manager class attributes do not change at runtime, list them once per class
+    manager_class = type(manager)
+    class_dir_names = _manager_class_dir_cache.get(manager_class)
+    if class_dir_names is None:
+        class_dir_names = frozenset(
+            m for m in dir(manager_class) if not m.startswith("_") and not m.isupper()
+        )
+        _manager_class_dir_cache[manager_class] = class_dir_names
+
     result = sorted(
-        [m for m in set(methods) if (not m.startswith("_") and not m.isupper())]
+        static_dir_names.union(
+            class_dir_names,
+            (
+                m
+                for m in manager._vendor_operations
+                if not m.startswith("_") and not m.isupper()
+            ),
+        )
     )
-    return result, False
+    manager._nornir_salt_dir_cache = (cache_key, result)
+
+    return list(result), False
 
 
 def _call_help(manager, method_name, *args, **kwargs):
@@ -285,12 +351,30 @@ def _call_help(manager, method_name, *args, **kwargs):
 
     :param method_name: (str) name of method or function to return docstring for
     """
-    if f"_call_{method_name}" in globals():
-        function_obj = globals()[f"_call_{method_name}"]
-    else:
-        function_obj = getattr(manager, method_name)
-    h = function_obj.__doc__ if hasattr(function_obj, "__doc__") else ""
-    return h, False
+    if method_name in ncclient_call_helpers_docs:
+        return ncclient_call_helpers_docs[method_name], False
+    function_obj = getattr(manager, method_name)
+    return getattr(function_obj, "__doc__", "") or "", False
+
+
+# helper functions dispatcher keyed by call name, collects all _call_* functions
+ncclient_call_dispatcher = {
+    name[len("_call_") :]: function
+    for name, function in list(globals().items())
+    if name.startswith("_call_") and callable(function)
+}
+
+# helper functions docstrings keyed by call name
+ncclient_call_helpers_docs = {
+    name: function.__doc__ or "" for name, function in ncclient_call_dispatcher.items()
+}
+
+# names of ncclient operations and helper functions listed by dir call
+static_dir_names = frozenset(
+    m
+    for m in (*(OPERATIONS if HAS_NCCLIENT else ()), *ncclient_call_dispatcher)
+    if not m.startswith("_") and not m.isupper()
+)
 
 
 @ValidateFuncArgs(model_ncclient_call)
@@ -299,6 +383,8 @@ def ncclient_call(task: Task, call: str, *args, **kwargs) -> Result:
     Task to handle a call of NCClient manager object methods
 
     :param call: (str) ncclient manager object method to call
+    :param pretty: (bool) if True (default) pretty prints XML replies, serializes them
+        without pretty printing otherwise
     :param arg: (list) any ``*args`` to use with call method
     :param kwargs: (dict) any ``**kwargs`` to use with call method
     """
@@ -311,6 +397,7 @@ def ncclient_call(task: Task, call: str, *args, **kwargs) -> Result:
     # initiate parameters
     failed = False
     task.name = call
+    pretty = kwargs.pop("pretty", True)
 
     # get rendered data if any
     if "__task__" in task.host.data:
@@ -319,11 +406,11 @@ def ncclient_call(task: Task, call: str, *args, **kwargs) -> Result:
     # check if filter formed properly - as per
     # https://ncclient.readthedocs.io/en/latest/manager.html#filter-params
     # filter should be a tuple of (type, criteria)
-    if kwargs.get("filter"):
-        if isinstance(kwargs["filter"], list):
-            kwargs["filter"] = tuple(kwargs["filter"])
-        elif isinstance(kwargs["filter"], str):
-            kwargs["filter"] = tuple([kwargs.pop("ftype", "subtree"), kwargs["filter"]])
+    filter_ = kwargs.get("filter")
+    if filter_ and isinstance(filter_, list):
+        kwargs["filter"] = tuple(filter_)
+    elif filter_ and isinstance(filter_, str):
+        kwargs["filter"] = (kwargs.pop("ftype", "subtree"), filter_)
 
     # get Ncclient NETCONF connection object
     manager = task.host.get_connection(CONNECTION_NAME, task.nornir.config)
@@ -332,14 +419,18 @@ def ncclient_call(task: Task, call: str, *args, **kwargs) -> Result:
     manager._vendor_operations.setdefault("rpc", GenericRPC)
 
     log.debug(
-        f"nornir_salt:ncclient_call '{call}' with args: '{args}'; kwargs: '{kwargs}'"
+        "nornir_salt:ncclient_call '%s' with args: '%s'; kwargs: '%s'",
+        call,
+        args,
+        kwargs,
     )
 
     # check if need to call one of helper function
-    if "_call_{}".format(call) in globals():
-        result, failed = globals()[f"_call_{call}"](manager, *args, **kwargs)
+    helper = ncclient_call_dispatcher.get(call)
+    if helper:
+        result, failed = helper(manager, *args, pretty=pretty, **kwargs)
     # call manager object method otherwise
     else:
         result = getattr(manager, call)(*args, **kwargs)
 
-    return Result(host=task.host, result=_form_result(result), failed=failed)
+    return Result(host=task.host, result=_form_result(result, pretty), failed=failed)
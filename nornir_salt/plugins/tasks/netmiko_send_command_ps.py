@@ -71,8 +71,11 @@ netmiko_send_command_ps reference
 .. autofunction:: nornir_salt.plugins.tasks.netmiko_send_command_ps.send_command_ps
 """
 
+import re
 import time
+import select
 import logging
+from collections import OrderedDict
 from typing import Any
 from nornir.core.task import Result, Task
 from difflib import get_close_matches
@@ -86,6 +89,98 @@ except ImportError:
 
 log = logging.getLogger(__name__)
 
+try:
+    from rapidfuzz.fuzz import ratio as fuzz_ratio
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    log.debug(
+        "nornir_salt:netmiko_send_command_ps failed import rapidfuzz library, falling back to difflib, install: pip install rapidfuzz"
+    )
+    HAS_RAPIDFUZZ = False
+
+# maximum number of previously seen prompts to remember per connection
+PROMPTS_SEEN_MAX = 64
+
+# typical device prompt e.g. "router1#", "user@router1>", "router1(config-if)#"
+PROMPT_RE = re.compile(r"[\w.\-@:/()]{1,64}[>#$]")
+
+# junos returns \x07 instead of space, translation table to replace it with spaces
+BELL_TABLE = str.maketrans({"\x07": " "})
+
+
+def _match_prompt(line: str, prompts, cutoff: float):
+    """
+    Helper function to check if line looks similar to any of the prompts.
+
+    :param line: (str) line to check
+    :param prompts: (tuple) prompts to compare line with
+    :param cutoff: (float) similarity ratio in range from 0 to 1 to consider
+        line similar to prompt
+    :return: first similar prompt or None
+    """
+    if HAS_RAPIDFUZZ:
+        score_cutoff = cutoff * 100
+        for prompt in prompts:
+            if fuzz_ratio(line, prompt, score_cutoff=score_cutoff) >= score_cutoff:
+                return prompt
+        return None
+    matched = get_close_matches(line, prompts, 1, cutoff)
+    return matched[0] if matched else None
+
+
+def _read_channel(connection):
+    """
+    Helper function to read data from netmiko connection channel.
+
+    :param connection: netmiko connection object
+    :return: (str) data read from channel
+    """
+    # read data from channel for netmiko 3
+    if hasattr(connection, "_read_channel"):
+        return connection._read_channel()
+    # read data from channel for netmiko 4
+    return connection.read_channel()
+
+
+def _wait_for_data(connection, timeout: float) -> bool:
+    """
+    Helper function to wait for data to become available on connection channel
+    using ``select``, sleeps for ``timeout`` if channel does not support it.
+
+    :param connection: netmiko connection object
+    :param timeout: (float) maximum time in seconds to wait for data
+    :return: True if channel has data to read, False otherwise
+    """
+    try:
+        ready, _, _ = select.select([connection.remote_conn], [], [], timeout)
+        return bool(ready)
+    except (AttributeError, TypeError, ValueError, OSError):
+        time.sleep(timeout)
+        return False
+
+
+def _drain_channel(connection, poll=0.05, idle=0.2, limit=3):
+    """
+    Helper function to read and discard data from channel until device
+    stops sending it.
+
+    :param connection: netmiko connection object
+    :param poll: (float) interval in seconds between channel reads
+    :param idle: (float) time in seconds without new data to consider channel drained
+    :param limit: (float) maximum time in seconds to drain channel for
+    """
+    start = last_data = time.monotonic()
+    while True:
+        time.sleep(poll)
+        now = time.monotonic()
+        if _read_channel(connection):
+            last_data = now
+        elif now - last_data >= idle:
+            break
+        if now - start >= limit:
+            break
+
 
 def send_command_ps(
     self,
@@ -99,6 +194,7 @@ def send_command_ps(
     normalize: bool = True,
     cutoff: float = 0.6,
     nowait: bool = False,
+    probe_interval: float = 0.5,
 ):
     """
     Execute command_string_ps on the SSH channel using promptless (ps) approach. Can be used
@@ -110,30 +206,36 @@ def send_command_ps(
         set to -1 will wait indefinitely
     :param timeout: (int) Absolute timeout in seconds of overall wait, default 120s, if
         set to -1 will wait indefinitely
-    :param inter_loop_sleep: (int) Interval in seconds to sleep between reading loops, default 0.1s
+    :param inter_loop_sleep: (int) Interval in seconds to wait for data between reading loops,
+        default 0.1s, reading starts as soon as data available if channel supports ``select``
     :param initial_sleep: (int) time to sleep after sending command, default 0.1s
     :param strip_prompt: (bool) Remove the trailing router prompt from the output (default: True).
     :param strip_command: (bool) Remove the echo of the command from the output (default: True).
     :param normalize: (bool) Ensure the proper enter is sent at end of command (default: True).
-    :param cutoff: (int) used as difflib get_close_matches cutoff argument to check if last line
-        looks similar to any previously seen prompts, default is 0.6
+    :param cutoff: (int) similarity ratio cutoff to check if last line looks similar to any
+        previously seen prompts, default is 0.6, uses ``rapidfuzz`` library if installed,
+        difflib get_close_matches otherwise; last lines that look like typical device
+        prompt e.g. ``router1#`` or ``user@router1>`` matched without similarity check
     :param nowait: (bool) Default is False, if True sends command and returns immediately without
         waiting for prompt right after ``initial_sleep`` timer elapsed.
+    :param probe_interval: (float) minimum interval in seconds between sending two space
+        characters to device to detect end of output, default 0.5s
     """
-    data_received = ""
+    chunks = []
+    tail = ""  # last line of received data including line break if any
     previous_last_line = ""
     no_data_elapsed = 0
     start_time = time.time()
+    probe_due = False
+    last_probe = time.monotonic() - probe_interval
 
     # add a list of previously matched last lines
     if not hasattr(self, "prompts_seen"):
-        self.prompts_seen = set([self.find_prompt().strip()])
-        time.sleep(
-            3
-        )  # need to wait for device to emit find_prompt() output so that self.clear_buffer() can catch it
-        log.debug(
-            "send_command_ps formed prompts_seen set: {}".format(self.prompts_seen)
-        )
+        self.prompts_seen = OrderedDict([(self.find_prompt().strip(), None)])
+        self.prompts_seen_tuple = tuple(self.prompts_seen)
+        # need to wait for device to finish emitting find_prompt() output
+        _drain_channel(self)
+        log.debug("send_command_ps formed prompts_seen: %s", self.prompts_seen_tuple)
 
     if normalize:
         command_string = self.normalize_cmd(command_string)
@@ -157,50 +259,66 @@ def send_command_ps(
         if timeout != -1 and (time.time() - start_time) > timeout:
             raise TimeoutError("send_command_ps {}s timeout expired".format(timeout))
 
-        time.sleep(inter_loop_sleep)
+        ready = _wait_for_data(self, inter_loop_sleep)
         no_data_elapsed += inter_loop_sleep
 
-        # read data from channel for netmiko 3
-        if hasattr(self, "_read_channel"):
-            chunk = self._read_channel()
-        # read data from channel for netmiko 4
-        else:
-            chunk = self.read_channel()
+        chunk = _read_channel(self)
+        # channel signalled but no data, e.g. channel closed, avoid busy looping
+        if ready and not chunk:
+            time.sleep(inter_loop_sleep)
         if chunk:
             no_data_elapsed = 0
-            data_received += chunk
-            new_last_line = data_received.splitlines()[-1]
-        else:
-            continue
-
-        # junos returns \x07 instead of space, replace it with spaces
-        if "\x07" in new_last_line:
-            new_last_line = new_last_line.replace("\x07", " ")
-
-        # check if new_last_line looks similar to any of the previous device prompts
-        matched = get_close_matches(
-            new_last_line.strip(), list(self.prompts_seen), 1, cutoff
-        )
-        log.debug(
-            "send_command_ps: last line '{}' similar prompt - '{}'".format(
-                new_last_line.strip(), matched
-            )
-        )
-        if matched:
-            # Detect end of output by sending two space chars and checking if received it back in next cycle
-            is_end = "{}  ".format(previous_last_line) == new_last_line
+            chunks.append(chunk)
+            # split only last line and new chunk instead of all received data
+            tail = (tail + chunk).splitlines(keepends=True)[-1]
+            new_last_line = tail.splitlines()[0]
+
+            # junos returns \x07 instead of space, replace it with spaces
+            new_last_line = new_last_line.translate(BELL_TABLE)
+
+            # check if new_last_line looks similar to any of the previous device prompts
+            stripped = new_last_line.strip()
+            if stripped in self.prompts_seen:
+                matched = stripped
+            elif PROMPT_RE.fullmatch(stripped):
+                matched = stripped
+            else:
+                matched = _match_prompt(stripped, self.prompts_seen_tuple, cutoff)
             log.debug(
-                "send_command_ps: EOF detection - new_last_line: '{}'; previous_last_line: {}; is_end: {}".format(
-                    [new_last_line], [previous_last_line], is_end
-                )
+                "send_command_ps: last line '%s' similar prompt - '%s'",
+                stripped,
+                matched,
             )
-            if is_end:
-                self.prompts_seen.add(new_last_line.strip())
-                break
-            previous_last_line = new_last_line
+            if matched:
+                # Detect end of output by sending two space chars and checking if received it back in next cycle
+                is_end = "{}  ".format(previous_last_line) == new_last_line
+                log.debug(
+                    "send_command_ps: EOF detection - new_last_line: '%s'; "
+                    "previous_last_line: %s; is_end: %s",
+                    [new_last_line],
+                    [previous_last_line],
+                    is_end,
+                )
+                if is_end:
+                    # remember prompt evicting least recently seen ones
+                    if stripped in self.prompts_seen:
+                        self.prompts_seen.move_to_end(stripped)
+                    else:
+                        self.prompts_seen[stripped] = None
+                        if len(self.prompts_seen) > PROMPTS_SEEN_MAX:
+                            self.prompts_seen.popitem(last=False)
+                        self.prompts_seen_tuple = tuple(self.prompts_seen)
+                    break
+                previous_last_line = new_last_line
+            probe_due = bool(matched)
+
+        # send EOF detection probe not more often than once per probe_interval
+        if probe_due and time.monotonic() - last_probe >= probe_interval:
             self.write_channel("  ")
+            last_probe = time.monotonic()
+            probe_due = False
     output = self._sanitize_output(
-        data_received,
+        "".join(chunks),
         strip_command=strip_command,
         command_string=command_string,
         strip_prompt=strip_prompt,
@@ -224,8 +342,8 @@ def netmiko_send_command_ps(
     if enable:
         net_connect.enable()
 
-    if "send_command_ps" not in dir(net_connect):
-        setattr(net_connect, "send_command_ps", send_command_ps)
+    if not hasattr(net_connect, "send_command_ps"):
+        net_connect.send_command_ps = send_command_ps.__get__(net_connect)
 
-    result = net_connect.send_command_ps(net_connect, command_string, **kwargs)
+    result = net_connect.send_command_ps(command_string, **kwargs)
     return Result(host=task.host, result=result)
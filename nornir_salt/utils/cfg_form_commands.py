@@ -28,14 +28,15 @@ def cfg_form_commands(task: Task, config: list = None, multiline: bool = False):
     :return: list of configuration commands if multiline is False, multiline string otherwise
     """
     config = config or []
+    task_data = task.host.data.get("__task__") or {}
 
     # get configuration from host data if any
-    if "config" in task.host.data.get("__task__", {}):
-        config = task.host.data["__task__"]["config"]
-    elif "commands" in task.host.data.get("__task__", {}):
-        config = task.host.data["__task__"]["commands"]
-    elif "filename" in task.host.data.get("__task__", {}):
-        config = task.host.data["__task__"]["filename"]
+    if "config" in task_data:
+        config = task_data["config"]
+    elif "commands" in task_data:
+        config = task_data["commands"]
+    elif "filename" in task_data:
+        config = task_data["filename"]
 
     # check if need to return multiline string
     if multiline and isinstance(config, (list, tuple)):
@@ -1,10 +1,44 @@
 import logging
+import functools
 
 from nornir.core.task import Task
 
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _normalize_commands(commands, split_lines: bool, new_line_char: str) -> tuple:
+    """
+    Helper function to normalize commands to a tuple of commands strings, results
+    cached to not normalize same commands again for every host.
+
+    :param commands: (str or tuple) multiline string or tuple of commands
+    :param split_lines: (bool) if True split multiline strings to commands
+    :param new_line_char: (str) characters to replace in commands with new line
+    :return: tuple of commands
+    """
+    # normalize commands to a list
+    if split_lines:
+        if isinstance(commands, str):
+            commands = commands.splitlines()
+        # handle a list of multiline command strings
+        else:
+            temp = []
+            for i in commands:
+                temp.extend(i.splitlines())
+            commands = temp
+    elif isinstance(commands, str):
+        commands = [commands]
+
+    # remove empty lines/commands that can left after rendering and
+    # replace new line characters - hit enter - in a single pass
+    return tuple(
+        c.replace(new_line_char, "\n") if new_line_char in c else c
+        for c in commands
+        if c.strip()
+    )
+
+
 def cli_form_commands(
     task: Task,
     commands: list = None,
@@ -37,37 +71,25 @@ def cli_form_commands(
         enter key
     """
     commands = commands or []
+    task_data = task.host.data.get("__task__") or {}
 
     # get per-host commands if any
-    if "commands" in task.host.data.get("__task__", {}):
+    if "commands" in task_data:
         if commands:
-            for c in task.host.data["__task__"]["commands"]:
-                if c not in commands:
-                    commands.append(c)
+            # use set to check for duplicates in constant time
+            existing = set(commands)
+            commands = commands + [
+                c
+                for c in task_data["commands"]
+                if not (c in existing or existing.add(c))
+            ]
         else:
-            commands = task.host.data["__task__"]["commands"]
-    elif "filename" in task.host.data.get("__task__", {}):
-        commands = task.host.data["__task__"]["filename"]
-
-    # normalize commands to a list
-    if split_lines:
-        if isinstance(commands, str):
-            commands = commands.splitlines()
-        # handle a list of multiline command strings
-        elif isinstance(commands, list):
-            temp = []
-            for i in commands:
-                temp.extend(i.splitlines())
-            commands = temp
-    elif isinstance(commands, str) and not split_lines:
-        commands = [commands]
-
-    # remove empty lines/commands that can left after rendering
-    commands = [c for c in commands if c.strip()]
+            commands = task_data["commands"]
+    elif "filename" in task_data:
+        commands = task_data["filename"]
 
-    # iterate over commands and see if need to add empty line - hit enter
-    commands = [
-        c.replace(new_line_char, "\n") if new_line_char in c else c for c in commands
-    ]
+    # normalize commands using cache, lists converted to tuples to be hashable
+    if not isinstance(commands, str):
+        commands = tuple(commands)
 
-    return commands
+    return list(_normalize_commands(commands, split_lines, new_line_char))
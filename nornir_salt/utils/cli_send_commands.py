@@ -40,7 +40,8 @@ def cli_send_commands(
     :param commands: (list) commands list to send
     :param kwargs: (dict) arguments to use with task plugin
     :param repeat: (int) number of times to repeat commands
-    :param interval: (int) time to in between sending commands
+    :param interval: (int) minimum time in between sending commands, counted from
+        previous command start
     :param stop_pattern: (str) glob pattern to check in output
     :param return_last: (int) if repeat greater then 1, returns requested last
         number of commands outputs
@@ -48,12 +49,15 @@ def cli_send_commands(
     """
     stop_patern_matched = False
     len_before = len(task.results) - 1  # record task results length
+    # form tasks names once, using first line of each command
+    names = [command.strip().splitlines()[0] for command in commands]
 
     for seq in range(repeat):
         for index, command in enumerate(commands):
-            name = command.strip().splitlines()[0]
+            name = names[index]
             name = "{}:{}".format(seq + 1, name) if repeat > 1 else name
             kwargs[plugin_fun_cmd_arg] = command
+            next_send = time.monotonic() + interval
             res = task.run(task=plugin_fun, name=name, **kwargs)
             # check if results contain pattern
             if stop_pattern and repeat > 1:
@@ -63,9 +67,12 @@ def cli_send_commands(
                     if stop_patern_matched is True
                     else any(fnmatchcase(str(r.result), stop_pattern) for r in res)
                 )
-            # do not wait after last command sent
+            # do not wait after last command sent, interval counted from the
+            # moment command was sent, no need to wait if task took longer
             if index + 1 < len(commands):
-                time.sleep(interval)
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
 
         if stop_patern_matched:
             break
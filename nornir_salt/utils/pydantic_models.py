@@ -102,6 +102,7 @@ class model_napalm_send_commands(BaseModel):
     interval: Optional[Union[StrictFloat, StrictInt]] = None
     new_line_char: Optional[StrictStr] = None
     split_lines: Optional[StrictBool] = None
+    batch_size: Optional[StrictInt] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -270,6 +271,12 @@ class model_file_remove(BaseModel):
         extra = "forbid"
 
 
+class FileDiffEnginesEnum(str, Enum):
+    difflib = "difflib"
+    cdifflib = "cdifflib"
+    dmp = "dmp"
+
+
 class model_file_diff(BaseModel):
     """Model for nornir_salt.plugins.tasks.file_diff plugin arguments"""
 
@@ -279,6 +286,9 @@ class model_file_diff(BaseModel):
     task_name: Optional[StrictStr] = None
     last: Optional[Union[StrictInt, List[StrictInt], StrictStr]] = None
     index: Optional[StrictStr] = "common"
+    engine: Optional[FileDiffEnginesEnum] = "difflib"
+    max_diff_size: Optional[StrictInt] = None
+    changed_only: Optional[StrictBool] = False
 
     class Config:
         arbitrary_types_allowed = True
@@ -312,6 +322,7 @@ class model_http_call(BaseModel):
     task: Task
     method: StrictStr
     url: Optional[StrictStr] = None
+    json_path: Optional[StrictStr] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -355,6 +366,7 @@ class model_ncclient_call(BaseModel):
     method_name: Optional[StrictStr] = None
     rpc: Optional[StrictStr] = None
     filter_: Optional[StrictStr] = None
+    pretty: Optional[StrictBool] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -19,6 +19,14 @@ from nornir_salt.plugins.functions import ResultSerializer
 from nornir_salt.plugins.inventory import DictInventory
 from nornir_salt.plugins.tasks import nr_test
 from nornir_salt.plugins.processors.DataProcessor import DataProcessor
+from nornir_salt.plugins.tasks.ncclient_call import _form_result
+
+try:
+    import lxml.etree as etree
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 
 logging.basicConfig(level=logging.ERROR)
@@ -170,6 +178,10 @@ skip_if_no_nornir = pytest.mark.skipif(
     HAS_NORNIR == False,
     reason="Failed to import all required Nornir modules and plugins",
 )
+skip_if_no_lxml = pytest.mark.skipif(
+    HAS_LXML == False,
+    reason="Failed to import lxml library",
+)
 skip_if_no_lab = None
 
 lab_inventory = """
@@ -792,6 +804,53 @@ def test_xml_xpath_smart_string_false():
 # test_xml_xpath_smart_string_false()
 
 
+class FakeNcclientReply:
+    """Mimics ncclient RPCReply object attributes used by ncclient_call"""
+
+    def __init__(self, xml):
+        self._raw = '<?xml version="1.0" encoding="UTF-8"?>' + xml
+        self._root = etree.fromstring(xml.strip().encode())
+
+
+@skip_if_no_nornir
+@skip_if_no_lxml
+@pytest.mark.parametrize("pretty", [True, False])
+def test_xml_xpath_ncclient_call_reply(pretty):
+    """ncclient_call results are XML filtered using XPATH"""
+    reply = _form_result(FakeNcclientReply(xml_ntp_data), pretty)
+    nr_with_dp = nr.with_processors(
+        [
+            DataProcessor(
+                [
+                    {
+                        "fun": "xpath",
+                        "expr": '//a:config/a:address[text()="1.1.1.11"]',
+                        "namespaces": {"a": "http://openconfig.net/yang/system"},
+                    }
+                ]
+            )
+        ]
+    )
+    output = nr_with_dp.run(
+        task=nr_test,
+        ret_data_per_host={
+            "IOL1": reply,
+            "IOL2": reply,
+        },
+        name="get_config",
+    )
+    result = ResultSerializer(output, to_dict=True)
+    # pprint.pprint(result, width=200)
+    assert not reply.startswith("<?xml")
+    for host in ["IOL1", "IOL2"]:
+        assert result[host]["get_config"].startswith(
+            '<address xmlns="http://openconfig.net/yang/system">1.1.1.11</address>'
+        )
+
+
+# test_xml_xpath_ncclient_call_reply()
+
+
 @skip_if_no_nornir
 def test_xml_xpath_ignore_namespaces():
     """results are XML filtered using XPATH"""
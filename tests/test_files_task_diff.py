@@ -40,6 +40,7 @@ from nornir_salt.plugins.tasks import (
     file_diff,
     files,
 )
+from nornir_salt.plugins.tasks.files import HAS_CDIFFLIB, HAS_DMP
 
 logging.basicConfig(level=logging.ERROR)
 
@@ -54,6 +55,14 @@ skip_if_no_nornir = pytest.mark.skipif(
     reason="Failed to import all required Nornir modules and plugins",
 )
 skip_if_no_lab = None
+skip_if_no_cdifflib = pytest.mark.skipif(
+    HAS_CDIFFLIB == False,
+    reason="Failed to import cdifflib library",
+)
+skip_if_no_dmp = pytest.mark.skipif(
+    HAS_DMP == False,
+    reason="Failed to import diff_match_patch library",
+)
 
 lab_inventory = """
 hosts:
@@ -164,6 +173,26 @@ def generate_files(tf):
     )
 
 
+def generate_diff_files(old, new):
+    """
+    Helper function to save two versions of results, IOL1 results change
+    from old to new while IOL2 results stay the same
+    """
+    nr_with_tf = nr.with_processors(
+        [ToFileProcessor(tf="intf_config", base_url="./tofile_outputs/")]
+    )
+    nr_with_tf.run(
+        task=nr_test,
+        ret_data_per_host={"IOL1": old, "IOL2": old},
+        name="show run",
+    )
+    nr_with_tf.run(
+        task=nr_test,
+        ret_data_per_host={"IOL1": new, "IOL2": old},
+        name="show run",
+    )
+
+
 # ----------------------------------------------------------------------
 # tests that need Nornir
 # ----------------------------------------------------------------------
@@ -326,3 +355,177 @@ ntp server 7.7.7.9
 
 
 # test_file_diff_whole_result_non_exist_filegroup()
+
+
+@skip_if_no_nornir
+@pytest.mark.parametrize(
+    "engine",
+    [
+        "difflib",
+        pytest.param("cdifflib", marks=skip_if_no_cdifflib),
+        pytest.param("dmp", marks=skip_if_no_dmp),
+    ],
+)
+def test_file_diff_engines(engine):
+    clean_up_folder()
+
+    # generate text files
+    iol1_res_old = "\n".join(
+        ["interface Eth{}\n description old\n!".format(i) for i in range(50)]
+    )
+    iol1_res_new = "\n".join(
+        [
+            "interface Eth{}\n description {}\n!".format(i, "new" if i % 10 else "old")
+            for i in range(50)
+        ]
+    )
+
+    nr_with_tf = nr.with_processors(
+        [ToFileProcessor(tf="intf_config", base_url="./tofile_outputs/")]
+    )
+    _ = nr_with_tf.run(
+        task=nr_test,
+        ret_data_per_host={"IOL1": iol1_res_old, "IOL2": iol1_res_old},
+        name="show run",
+    )
+    _ = nr_with_tf.run(
+        task=nr_test,
+        ret_data_per_host={"IOL1": iol1_res_new, "IOL2": iol1_res_old},
+        name="show run",
+    )
+
+    # run task to diff using given engine
+    output_engine = nr.run(
+        task=file_diff,
+        base_url="./tofile_outputs/",
+        filegroup="intf_config",
+        engine=engine,
+    )
+    res_engine = ResultSerializer(output_engine, add_details=True)
+
+    # pprint.pprint(res_engine, width=150)
+
+    assert (
+        res_engine["IOL1"]["intf_config"]["result"].count("- description old\n") == 45
+    )
+    assert (
+        res_engine["IOL1"]["intf_config"]["result"].count("+ description new\n") == 45
+    )
+    assert res_engine["IOL2"]["intf_config"]["result"] == True
+
+
+# test_file_diff_engines()
+
+
+@skip_if_no_nornir
+def test_file_diff_large_repetitive_config():
+    clean_up_folder()
+
+    # generate large config with frequently repeated lines like "!"
+    iol1_res_old = "\n".join(
+        [
+            "interface Eth{}\n description old\n shutdown\n!".format(i)
+            for i in range(5000)
+        ]
+    )
+    iol1_res_new = "\n".join(
+        [
+            "interface Eth{}\n description {}\n shutdown\n!".format(
+                i, "new" if i % 100 == 0 else "old"
+            )
+            for i in range(5000)
+        ]
+    )
+
+    nr_with_tf = nr.with_processors(
+        [ToFileProcessor(tf="large_config", base_url="./tofile_outputs/")]
+    )
+    _ = nr_with_tf.run(
+        task=nr_test,
+        ret_data_per_host={"IOL1": iol1_res_old, "IOL2": iol1_res_old},
+        name="show run",
+    )
+    _ = nr_with_tf.run(
+        task=nr_test,
+        ret_data_per_host={"IOL1": iol1_res_new, "IOL2": iol1_res_old},
+        name="show run",
+    )
+
+    # run task to diff and time it
+    start = time.time()
+    output = nr.run(
+        task=file_diff,
+        base_url="./tofile_outputs/",
+        filegroup="large_config",
+    )
+    elapsed = time.time() - start
+    res = ResultSerializer(output, add_details=True)
+
+    # pprint.pprint(res, width=150)
+    print("file_diff of large repetitive config took {}s".format(elapsed))
+
+    assert elapsed < 10
+    assert res["IOL1"]["large_config"]["result"].count("- description old\n") == 50
+    assert res["IOL1"]["large_config"]["result"].count("+ description new\n") == 50
+    assert res["IOL2"]["large_config"]["result"] == True
+
+
+# test_file_diff_large_repetitive_config()
+
+
+@skip_if_no_nornir
+def test_file_diff_max_diff_size():
+    clean_up_folder()
+    generate_diff_files(
+        old="\n".join(
+            ["interface Eth{}\n description old\n!".format(i) for i in range(50)]
+        ),
+        new="\n".join(
+            ["interface Eth{}\n description new\n!".format(i) for i in range(50)]
+        ),
+    )
+
+    output = nr.run(
+        task=file_diff,
+        base_url="./tofile_outputs/",
+        filegroup="intf_config",
+        max_diff_size=200,
+    )
+    res = ResultSerializer(output, add_details=True)
+
+    # pprint.pprint(res, width=150)
+
+    assert (
+        "difference truncated, exceeded max_diff_size 200"
+        in res["IOL1"]["intf_config"]["result"]
+    )
+    assert res["IOL1"]["intf_config"]["result"].count("+ description new\n") < 50
+    assert res["IOL2"]["intf_config"]["result"] == True
+
+
+# test_file_diff_max_diff_size()
+
+
+@skip_if_no_nornir
+def test_file_diff_changed_only():
+    clean_up_folder()
+    generate_diff_files(
+        old="interface Eth1\n description old\n!",
+        new="interface Eth1\n description new\n!",
+    )
+
+    output = nr.run(
+        task=file_diff,
+        base_url="./tofile_outputs/",
+        filegroup="intf_config",
+        changed_only=True,
+    )
+    res = ResultSerializer(output, add_details=True)
+
+    # pprint.pprint(res, width=150)
+
+    assert res["IOL1"]["intf_config"]["result"] is True
+    assert res["IOL2"]["intf_config"]["result"] is False
+
+
+# test_file_diff_changed_only()
@@ -1424,3 +1424,138 @@ ntp server 7.7.7.9
 
 
 # test_file_diff_whole_result_last_2_1_string()
+
+
+@skip_if_no_nornir
+def test_file_read_task_name_non_ascii_byte_span():
+    """Results read using byte_span should match results read using span"""
+    clean_up_folder()
+
+    iol1_res_ntp = "описание ntp server 7.7.7.8 – ünïcödé ✓\n"
+    iol1_res_log = "logging host 1.2.3.4 — журнал ✓\n"
+
+    # run test to generate the file
+    nr_with_tf = nr.with_processors(
+        [ToFileProcessor(tf="config_non_ascii", base_url="./tofile_outputs/")]
+    )
+    nr_with_tf.run(
+        task=nr_test_grouped_subtasks,
+        task_1={
+            "task": nr_test,
+            "ret_data_per_host": {"IOL1": iol1_res_ntp, "IOL2": iol1_res_ntp},
+            "name": "show run | inc ntp",
+        },
+        task_2={
+            "task": nr_test,
+            "ret_data_per_host": {"IOL1": iol1_res_log, "IOL2": iol1_res_log},
+            "name": "show run | inc logging",
+        },
+    )
+
+    # verify index contains both spans and they differ for non ASCII content
+    with open("./tofile_outputs/tf_index_common.json", encoding="utf-8") as f:
+        index_data = json.load(f)
+    task_details = index_data["config_non_ascii"]["IOL1"][0]["tasks"][
+        "show run | inc logging"
+    ]
+    assert "byte_span" in task_details
+    assert task_details["byte_span"] != task_details["span"]
+
+    # retrieve file content using byte_span
+    res_byte_span = nr.run(
+        task=file_read,
+        filegroup="config_non_ascii",
+        base_url="./tofile_outputs/",
+        task_name="show run | inc logging",
+    )
+    res_byte_span = ResultSerializer(res_byte_span, add_details=True)
+
+    # remove byte_span from index to read file content using span
+    for host_entries in index_data["config_non_ascii"].values():
+        for entry in host_entries:
+            for details in entry["tasks"].values():
+                details.pop("byte_span")
+    with open("./tofile_outputs/tf_index_common.json", "w", encoding="utf-8") as f:
+        json.dump(index_data, f)
+
+    res_span = nr.run(
+        task=file_read,
+        filegroup="config_non_ascii",
+        base_url="./tofile_outputs/",
+        task_name="show run | inc logging",
+    )
+    res_span = ResultSerializer(res_span, add_details=True)
+
+    # pprint.pprint(res_byte_span)
+    # pprint.pprint(res_span)
+
+    for host in ["IOL1", "IOL2"]:
+        assert res_byte_span[host]["show run | inc logging"]["result"] == iol1_res_log
+        assert res_span[host]["show run | inc logging"]["result"] == iol1_res_log
+
+
+# test_file_read_task_name_non_ascii_byte_span()
+
+
+@skip_if_no_nornir
+def test_file_read_task_name_old_index_without_byte_span():
+    """Index saved before byte_span was added should still be readable"""
+    clean_up_folder()
+
+    iol1_res_ntp = "ntp server 7.7.7.8\n"
+    iol1_res_log = "logging host 1.2.3.4 ✓\n"
+
+    # run test to generate the file
+    nr_with_tf = nr.with_processors(
+        [ToFileProcessor(tf="config_old_index", base_url="./tofile_outputs/")]
+    )
+    nr_with_tf.run(
+        task=nr_test_grouped_subtasks,
+        task_1={
+            "task": nr_test,
+            "ret_data_per_host": {"IOL1": iol1_res_ntp, "IOL2": iol1_res_ntp},
+            "name": "show run | inc ntp",
+        },
+        task_2={
+            "task": nr_test,
+            "ret_data_per_host": {"IOL1": iol1_res_log, "IOL2": iol1_res_log},
+            "name": "show run | inc logging",
+        },
+    )
+
+    # rewrite index in old format without byte_span
+    with open("./tofile_outputs/tf_index_common.json", encoding="utf-8") as f:
+        index_data = json.load(f)
+    for host_entries in index_data["config_old_index"].values():
+        for entry in host_entries:
+            for details in entry["tasks"].values():
+                details.pop("byte_span", None)
+    with open("./tofile_outputs/tf_index_common.json", "w", encoding="utf-8") as f:
+        json.dump(index_data, f, sort_keys=True, indent=4, separators=(",", ": "))
+
+    # retrieve file content for each task and for all tasks
+    res_task = nr.run(
+        task=file_read,
+        filegroup="config_old_index",
+        base_url="./tofile_outputs/",
+        task_name="show run | inc logging",
+    )
+    res_task = ResultSerializer(res_task, add_details=True)
+    res_all = nr.run(
+        task=file_read,
+        filegroup="config_old_index",
+        base_url="./tofile_outputs/",
+    )
+    res_all = ResultSerializer(res_all, add_details=True)
+
+    # pprint.pprint(res_task)
+    # pprint.pprint(res_all)
+
+    for host in ["IOL1", "IOL2"]:
+        assert res_task[host]["show run | inc logging"]["result"] == iol1_res_log
+        assert "show run | inc ntp" not in res_task[host]
+        assert res_all[host]["show run | inc ntp"]["result"] == iol1_res_ntp
+        assert res_all[host]["show run | inc logging"]["result"] == iol1_res_log
+
+
+# test_file_read_task_name_old_index_without_byte_span()
@@ -5,8 +5,13 @@ import logging
 import yaml
 import pytest
 import time
+import json
+import threading
+import importlib
 import requests
 
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 sys.path.insert(0, "..")
 
 try:
@@ -24,6 +29,8 @@ from nornir_salt.plugins.inventory import DictInventory
 from nornir_salt.plugins.tasks import http_call
 from nornir_salt.plugins.connections import HTTPPlugin
 
+http_call_module = importlib.import_module("nornir_salt.plugins.tasks.http_call")
+
 logging.basicConfig(level=logging.ERROR)
 
 
@@ -99,6 +106,57 @@ groups:
     """
 cisco_always_on_sandpox_inventory = yaml.safe_load(cisco_always_on_sandpox)
 
+# ----------------------------------------------------------------------
+# Local HTTP server
+# ----------------------------------------------------------------------
+
+local_server_clients = []  # list of (ip, port) tuples requests received from
+local_server_data = {
+    "data": {"interfaces": [{"name": "eth1", "mtu": 1500}, {"name": "eth2"}]}
+}
+
+
+class LocalJSONHandler(BaseHTTPRequestHandler):
+    """
+    Handler to reply with JSON data keeping connections alive
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        local_server_clients.append(self.client_address)
+        body = json.dumps(local_server_data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/yang-data+json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+local_server = ThreadingHTTPServer(("127.0.0.1", 0), LocalJSONHandler)
+local_server.daemon_threads = True
+threading.Thread(target=local_server.serve_forever, daemon=True).start()
+
+local_inventory = """
+hosts:
+  local:
+    hostname: 127.0.0.1
+    platform: ios
+    username: nornir
+    password: nornir
+    connection_options:
+      http:
+        port: {port}
+        extras:
+          transport: http
+""".format(
+    port=local_server.server_address[1]
+)
+local_inventory_dict = yaml.safe_load(local_inventory)
+
 
 def init(opts):
     """
@@ -126,6 +184,7 @@ ConnectionPluginRegister.register("http", HTTPPlugin)
 
 nr = init(lab_inventory_dict)
 always_on_nr = init(cisco_always_on_sandpox_inventory)
+local_nr = init(local_inventory_dict)
 
 
 def clean_up_folder():
@@ -175,6 +234,112 @@ def test_http_connection_open():
 
 # test_http_connection_open()
 
+
+@skip_if_no_nornir
+def test_http_call_invalid_method():
+    requests_count = len(local_server_clients)
+    res = ResultSerializer(
+        local_nr.run(task=http_call, method="foo", url="/data"), add_details=True
+    )
+    # pprint.pprint(res)
+
+    assert res["local"]["http_call"]["failed"] == True
+    assert "unsupported method 'foo'" in res["local"]["http_call"]["exception"]
+    assert len(local_server_clients) == requests_count
+
+
+# test_http_call_invalid_method()
+
+
+@skip_if_no_nornir
+def test_http_call_invalid_url_scheme():
+    res = ResultSerializer(
+        nr.run(task=http_call, method="get", url="ftp://192.168.217.10/data"),
+        add_details=True,
+    )
+    # pprint.pprint(res)
+
+    for host in ["IOL1", "IOL2"]:
+        assert res[host]["get"]["failed"] == True
+        assert "cannot form URL" in res[host]["get"]["exception"]
+
+
+# test_http_call_invalid_url_scheme()
+
+
+@skip_if_no_nornir
+@pytest.mark.parametrize("has_ijson", [True, False])
+def test_http_call_json_path(has_ijson, monkeypatch):
+    if has_ijson and not http_call_module.HAS_IJSON:
+        pytest.skip("Failed to import ijson library")
+    monkeypatch.setattr(http_call_module, "HAS_IJSON", has_ijson)
+
+    res_names = ResultSerializer(
+        local_nr.run(
+            task=http_call,
+            method="get",
+            url="/data",
+            json_path="data.interfaces.item.name",
+        ),
+        add_details=True,
+    )
+    res_dict = ResultSerializer(
+        local_nr.run(
+            task=http_call,
+            method="get",
+            url="/data",
+            json_path="data.interfaces",
+        ),
+        add_details=True,
+    )
+    res_missing = ResultSerializer(
+        local_nr.run(
+            task=http_call,
+            method="get",
+            url="/data",
+            json_path="data.vlans",
+        ),
+        add_details=True,
+    )
+    # pprint.pprint(res_names)
+
+    assert res_names["local"]["get"]["failed"] == False
+    assert res_names["local"]["get"]["result"] == ["eth1", "eth2"]
+    assert res_dict["local"]["get"]["result"] == [
+        {"name": "eth1", "mtu": 1500},
+        {"name": "eth2"},
+    ]
+    assert res_missing["local"]["get"]["result"] == None
+
+
+# test_http_call_json_path()
+
+
+@skip_if_no_nornir
+def test_http_plugin_session_reuse_and_close(monkeypatch):
+    # run several calls and check they sent over the same TCP connection
+    del local_server_clients[:]
+    for i in range(3):
+        res = ResultSerializer(
+            local_nr.run(task=http_call, method="get", url="/data"), add_details=True
+        )
+        assert res["local"]["get"]["result"] == local_server_data
+    assert len(local_server_clients) == 3
+    assert len(set(local_server_clients)) == 1
+
+    # check session closed on connection close
+    conn = local_nr.inventory.hosts["local"].get_connection("http", local_nr.config)
+    session = conn["session"]
+    closed = []
+    monkeypatch.setattr(session, "close", lambda: closed.append(True))
+    local_nr.close_connections()
+
+    assert closed == [True]
+    assert "http" not in local_nr.inventory.hosts["local"].connections
+
+
+# test_http_plugin_session_reuse_and_close()
+
 # ----------------------------------------------------------------------
 # tests that need Nornir and Internet access
 # ----------------------------------------------------------------------
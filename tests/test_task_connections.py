@@ -17,6 +17,7 @@ sys.path.insert(0, "..")
 try:
     from nornir import InitNornir
     from nornir.core.plugins.inventory import InventoryPluginRegister
+    from nornir.core.plugins.connections import ConnectionPluginRegister
     from nornir.core.task import Result
 
     HAS_NORNIR = True
@@ -30,6 +31,38 @@ from nornir_salt.plugins.tasks import connections
 logging.basicConfig(level=logging.ERROR)
 InventoryPluginRegister.register("DictInventory", DictInventory)
 
+
+class FakeConnection:
+    """
+    Connection plugin that fails to open unless username is "good"
+    """
+
+    opened = []  # list of connection objects open called for
+
+    def open(
+        self, hostname, username, password, port, platform, extras, configuration
+    ):
+        self.opened.append(self)
+        if username != "good":
+            raise ConnectionRefusedError("bad username '{}'".format(username))
+        self.connection = True
+
+    def close(self):
+        self.connection = None
+
+
+ConnectionPluginRegister.register("fake_conn", FakeConnection)
+
+fake_conn_inventory = """
+hosts:
+  fake_host:
+    hostname: 127.0.0.1
+    platform: ios
+    username: bad
+    password: bad
+"""
+fake_conn_inventory_dict = yaml.safe_load(fake_conn_inventory)
+
 skip_if_no_nornir = pytest.mark.skipif(
     HAS_NORNIR == False,
     reason="Failed to import all required Nornir modules and plugins",
@@ -141,3 +174,27 @@ def test_connection_check_non_existing_conn_name():
     assert (
         result["sandbox-iosxr-1.cisco.com"]["connections"]["result"] == True
     ), "Connection check should not have failed"
+
+
+@skip_if_no_nornir
+def test_conn_open_reconnect_pops_stale_connection():
+    del FakeConnection.opened[:]
+    nr = init(fake_conn_inventory_dict)
+    output = nr.run(
+        task=connections,
+        call="open",
+        conn_name="fake_conn",
+        reconnect=[{"username": "good", "password": "good"}],
+    )
+    result = ResultSerializer(output, add_details=True)
+    host = nr.inventory.hosts["fake_host"]
+
+    pprint.pprint(result)
+
+    # primary connection failed, reconnect opened new connection object
+    assert len(FakeConnection.opened) == 2
+    stale_conn, fallback_conn = FakeConnection.opened
+    assert stale_conn is not fallback_conn
+    assert host.connections["fake_conn"] is fallback_conn
+    assert result["fake_host"]["connections"]["failed"] == False
+    assert "reconnect index '0'" in result["fake_host"]["connections"]["result"]